@@ -0,0 +1,468 @@
+# 다운로드 → 압축 해제 → 패치 적용 → Steamgrid 배치 성능 측정 도구
+# 실제 패치와 같은 형태의 가상 패치 파일을 만들어 로컬 HTTP 서버에서 내려받고,
+# 단계별 소요 시간, 기록한 바이트 수, 최대 메모리 사용량, 임시 디스크 사용량을 측정합니다.
+#
+# 사용 예:
+#   python benchmark.py --output bench.json
+#   python benchmark.py --baseline bench.json   (처리 속도가 기준보다 느려지면 종료 코드 1)
+
+import argparse
+import ctypes
+import http.server
+import json
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from pathlib import Path
+
+import main
+
+# 메모리와 디스크 사용량을 확인하는 간격 (초)
+SAMPLE_INTERVAL = 0.02
+
+# 기준 결과보다 이 비율 이상 느려지면 성능 저하로 판단
+DEFAULT_TOLERANCE = 0.15
+
+BENCHMARK_FILE_ID = "benchmark-archive"
+
+
+# 현재 프로세스의 메모리 사용량 (바이트)
+def get_process_rss():
+    if sys.platform == "win32":
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", ctypes.c_ulong),
+                ("PageFaultCount", ctypes.c_ulong),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        get_process_memory_info = ctypes.windll.psapi.GetProcessMemoryInfo
+        get_process_memory_info.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ProcessMemoryCounters),
+            ctypes.c_ulong,
+        ]
+        get_process_memory_info(
+            ctypes.windll.kernel32.GetCurrentProcess(),
+            ctypes.byref(counters),
+            counters.cb,
+        )
+        return counters.WorkingSetSize
+    try:
+        with open("/proc/self/statm", "r") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+# 폴더 안 파일 크기의 합 (하드 링크는 한 번만 셈)
+def get_tree_size(path):
+    total = 0
+    seen = set()
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                stat = os.stat(os.path.join(root, name))
+            except OSError:
+                continue
+            if stat.st_nlink > 1:
+                if (stat.st_dev, stat.st_ino) in seen:
+                    continue
+                seen.add((stat.st_dev, stat.st_ino))
+            total += stat.st_size
+    return total
+
+
+# 단계 실행 중 메모리와 디스크 사용량의 최댓값을 주기적으로 기록
+class ResourceSampler:
+    def __init__(self, disk_path, interval=SAMPLE_INTERVAL):
+        self.disk_path = disk_path
+        self.interval = interval
+        self.peak_rss = 0
+        self.peak_disk_bytes = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        rss = get_process_rss()
+        if rss is not None:
+            self.peak_rss = max(self.peak_rss, rss)
+        used = self._disk_free_at_start - shutil.disk_usage(self.disk_path).free
+        self.peak_disk_bytes = max(self.peak_disk_bytes, used)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self._disk_free_at_start = shutil.disk_usage(self.disk_path).free
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        return False
+
+
+# 실제 패치 파일과 같은 구조의 가상 패치 파일 생성
+# layout이 "root"이면 "… 패치" 폴더 아래에, "data"이면 봉+ 패치처럼 'Data' 폴더 아래에 파일을 둡니다.
+def generate_synthetic_archive(
+    zip_path,
+    layout="root",
+    small_files=2000,
+    small_size=4 * 1024,
+    large_files=4,
+    large_size=64 * 1024 * 1024,
+    seed=0,
+):
+    rng = random.Random(seed)
+    prefix = "쓰르라미 울 적에 한글 패치/" if layout == "root" else "Data/"
+    data_dir = f"{prefix}HigurashiEp01_Data"
+
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+        # 스크립트 파일: 압축이 잘 되는 텍스트
+        words = [f"word{index}".encode() for index in range(256)]
+        for index in range(small_files):
+            content = b" ".join(rng.choice(words) for _ in range(small_size // 6))[
+                :small_size
+            ]
+            zip_ref.writestr(
+                f"{data_dir}/StreamingAssets/Scripts/script_{index:05d}.txt", content
+            )
+        # 리소스 파일: 압축이 거의 되지 않는 데이터
+        for index in range(large_files):
+            with zip_ref.open(
+                f"{data_dir}/StreamingAssets/AssetBundles/asset_{index:02d}.assets",
+                "w",
+                force_zip64=True,
+            ) as target:
+                remaining = large_size
+                while remaining > 0:
+                    chunk_size = min(remaining, main.COPY_BUFFER_SIZE)
+                    target.write(rng.randbytes(chunk_size))
+                    remaining -= chunk_size
+    return Path(zip_path)
+
+
+# Range 요청을 지원하는 로컬 HTTP 서버 (구글 드라이브 대신 사용)
+class ArchiveRequestHandler(http.server.BaseHTTPRequestHandler):
+    archive_path = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_archive(send_body=False)
+
+    def do_GET(self):
+        self.send_archive(send_body=True)
+
+    def send_archive(self, send_body):
+        size = self.archive_path.stat().st_size
+        start, end = 0, size - 1
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if match:
+            start = int(match.group(1))
+            end = min(int(match.group(2)) if match.group(2) else end, end)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        if not send_body:
+            return
+
+        with open(self.archive_path, "rb") as file:
+            file.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = file.read(min(remaining, main.COPY_BUFFER_SIZE))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+
+def start_archive_server(archive_path):
+    handler = type(
+        "BenchmarkArchiveHandler",
+        (ArchiveRequestHandler,),
+        {"archive_path": Path(archive_path)},
+    )
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# 단계 하나를 실행하며 측정
+def measure_stage(name, work_dir, func, output_path=None):
+    with ResourceSampler(work_dir) as sampler:
+        started_at = time.perf_counter()
+        detail = func()
+        seconds = time.perf_counter() - started_at
+    bytes_written = get_tree_size(output_path) if output_path else 0
+    result = {
+        "stage": name,
+        "seconds": seconds,
+        "bytes_written": bytes_written,
+        "throughput": bytes_written / seconds if seconds > 0 else 0,
+        "peak_rss": sampler.peak_rss,
+        "peak_disk_bytes": sampler.peak_disk_bytes,
+    }
+    if isinstance(detail, dict):
+        result["detail"] = detail
+    print(
+        f"{name:<16} {seconds:8.2f}초  기록 {main.format_bytes(bytes_written):>10}"
+        f"  속도 {main.format_bytes(result['throughput']):>10}/s"
+        f"  메모리 {main.format_bytes(sampler.peak_rss):>10}"
+        f"  디스크 {main.format_bytes(sampler.peak_disk_bytes):>10}",
+        file=sys.stderr,
+    )
+    return result
+
+
+# 한 번의 측정: 다운로드 → 압축 해제 → 패치 적용(처음/변경 없음) → Steamgrid 배치
+def run_benchmark_once(
+    archive_path, work_dir, server_url, steamgrid_users, special_handling=False
+):
+    stages = []
+
+    cache = main.ArchiveCache(work_dir / "cache")
+
+    def local_downloader(
+        file_id, destination, progress_callback=None, progress_hook=None
+    ):
+        main.download_file(
+            f"{server_url}/{file_id}.zip",
+            destination,
+            progress_hook=progress_hook,
+        )
+
+    cached = {}
+
+    def download_stage():
+        cached["path"] = cache.fetch(BENCHMARK_FILE_ID, local_downloader)
+
+    stages.append(measure_stage("download", work_dir, download_stage, cache.blob_dir))
+    zip_path = cached["path"]
+
+    extract_dir = work_dir / "extract"
+    stages.append(
+        measure_stage(
+            "extract",
+            work_dir,
+            lambda: main.extract_zip(zip_path, extract_dir),
+            extract_dir,
+        )
+    )
+    shutil.rmtree(extract_dir, ignore_errors=True)
+
+    game_dir = work_dir / "game"
+    (game_dir / "HigurashiEp01_Data").mkdir(parents=True)
+    stages.append(
+        measure_stage(
+            "apply",
+            work_dir,
+            lambda: main.apply_patch_archive(
+                zip_path,
+                game_dir,
+                special_handling=special_handling,
+                archive_hash=zip_path.stem,
+            ),
+            game_dir,
+        )
+    )
+    # 이미 적용된 상태에서 다시 적용 (변경 없는 파일을 건너뛰는지 확인)
+    stages.append(
+        measure_stage(
+            "apply_unchanged",
+            work_dir,
+            lambda: main.apply_patch_archive(
+                zip_path,
+                game_dir,
+                special_handling=special_handling,
+                archive_hash=zip_path.stem,
+            ),
+        )
+    )
+
+    steam_dir = work_dir / "steam"
+    for index in range(steamgrid_users):
+        (steam_dir / "userdata" / str(100000 + index)).mkdir(parents=True)
+    stages.append(
+        measure_stage(
+            "steamgrid",
+            work_dir,
+            lambda: main.apply_steamgrid_images(steam_dir),
+            steam_dir,
+        )
+    )
+    return stages
+
+
+# 여러 번 측정한 결과 중 단계별로 가장 빠른 값을 사용
+def summarize_runs(runs):
+    summary = {}
+    for stages in runs:
+        for stage in stages:
+            best = summary.get(stage["stage"])
+            if best is None or stage["seconds"] < best["seconds"]:
+                summary[stage["stage"]] = stage
+    return summary
+
+
+# 기준 결과와 비교하여 느려진 단계 목록 반환
+def find_regressions(summary, baseline, tolerance):
+    regressions = []
+    for name, stage in summary.items():
+        base_stage = baseline.get("stages", {}).get(name)
+        if not base_stage:
+            continue
+        # 기록하는 데이터가 없는 단계는 소요 시간으로 비교
+        if base_stage["throughput"] and stage["throughput"]:
+            ratio = stage["throughput"] / base_stage["throughput"]
+        else:
+            ratio = base_stage["seconds"] / stage["seconds"] if stage["seconds"] else 1
+        if ratio < 1 - tolerance:
+            regressions.append({"stage": name, "ratio": ratio})
+    return regressions
+
+
+def build_argument_parser():
+    parser = argparse.ArgumentParser(
+        description="패치 다운로드/압축 해제/적용 성능을 가상 패치 파일로 측정합니다."
+    )
+    parser.add_argument(
+        "--layout",
+        choices=("root", "data"),
+        default="root",
+        help="패치 파일 구조 (root: '… 패치' 폴더 포함, data: Data 폴더만)",
+    )
+    parser.add_argument("--small-files", type=int, default=2000)
+    parser.add_argument("--small-size", type=int, default=4 * 1024)
+    parser.add_argument("--large-files", type=int, default=4)
+    parser.add_argument("--large-size", type=int, default=64 * 1024 * 1024)
+    parser.add_argument("--steamgrid-users", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--work-dir", help="측정에 사용할 폴더 (기본값: 시스템 임시 폴더)"
+    )
+    parser.add_argument("--output", help="측정 결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 이전 측정 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    return parser
+
+
+def run(args):
+    # Steamgrid 이미지는 저장소 기준 상대 경로로 찾음
+    os.chdir(Path(__file__).resolve().parent)
+    base_dir = Path(tempfile.mkdtemp(prefix="kr_patch_bench_", dir=args.work_dir))
+    try:
+        archive_dir = base_dir / "archive"
+        archive_dir.mkdir()
+        archive_path = generate_synthetic_archive(
+            archive_dir / f"{BENCHMARK_FILE_ID}.zip",
+            args.layout,
+            args.small_files,
+            args.small_size,
+            args.large_files,
+            args.large_size,
+            args.seed,
+        )
+        print(
+            f"가상 패치 파일: {main.format_bytes(archive_path.stat().st_size)}",
+            file=sys.stderr,
+        )
+        server = start_archive_server(archive_path)
+        server_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        runs = []
+        try:
+            for index in range(args.repeat):
+                print(f"[{index + 1}/{args.repeat}]", file=sys.stderr)
+                work_dir = base_dir / f"run{index}"
+                work_dir.mkdir()
+                runs.append(
+                    run_benchmark_once(
+                        archive_path,
+                        work_dir,
+                        server_url,
+                        args.steamgrid_users,
+                        args.layout == "data",
+                    )
+                )
+                shutil.rmtree(work_dir, ignore_errors=True)
+        finally:
+            server.shutdown()
+    finally:
+        shutil.rmtree(base_dir, ignore_errors=True)
+
+    report = {
+        "version": main.__version__,
+        "time": time.time(),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "config": {
+            "layout": args.layout,
+            "small_files": args.small_files,
+            "small_size": args.small_size,
+            "large_files": args.large_files,
+            "large_size": args.large_size,
+            "steamgrid_users": args.steamgrid_users,
+        },
+        "repeat": args.repeat,
+        "stages": summarize_runs(runs),
+    }
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        if baseline.get("config") != report["config"]:
+            print("경고: 기준 결과와 측정 조건이 다릅니다.", file=sys.stderr)
+        report["regressions"] = find_regressions(
+            report["stages"], baseline, args.tolerance
+        )
+        for regression in report["regressions"]:
+            print(
+                f"성능 저하: {regression['stage']} "
+                f"(기준 대비 {regression['ratio'] * 100:.0f}%)",
+                file=sys.stderr,
+            )
+        if report["regressions"]:
+            exit_code = 1
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(run(build_argument_parser().parse_args()))
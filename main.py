@@ -1,32 +1,317 @@
+import time
+
+# 프로그램 시작 시각 (첫 창 표시까지 걸린 시간 측정용)
+PROCESS_START_TIME = time.perf_counter()
+
+import builtins
+import sys
+import threading
+
+
+# 모듈별 import 시간 기록 (--profile-startup)
+# 모듈 수준 import까지 기록할 수 있도록 다른 import보다 먼저 정의하고 설치합니다.
+class ImportTimer:
+    def __init__(self):
+        self.timings = []
+        self._original_import = None
+        self._local = threading.local()
+
+    def install(self):
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # 이미 불러온 모듈은 기록하지 않음
+        if level == 0 and name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            self._local.depth = depth
+            self.timings.append(
+                {
+                    "module": name,
+                    "seconds": time.perf_counter() - start,
+                    "depth": depth,
+                    "thread": threading.current_thread().name,
+                }
+            )
+
+    # 시작 시간 보고서 저장 (가장 오래 걸린 최상위 import 순)
+    def write_report(self, report_path, time_to_first_window=None):
+        top_level = sorted(
+            (timing for timing in self.timings if timing["depth"] == 0),
+            key=lambda timing: timing["seconds"],
+            reverse=True,
+        )
+        report = {
+            "version": __version__,
+            "module_load_seconds": MODULE_LOADED_TIME - PROCESS_START_TIME,
+            "time_to_first_window": time_to_first_window,
+            "startup_budget_seconds": STARTUP_BUDGET_SECONDS,
+            "imports": top_level,
+            "all_imports": self.timings,
+        }
+        report_path = Path(report_path)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+
+        for timing in top_level[:15]:
+            logger.info(f"{timing['seconds'] * 1000:8.1f} ms  {timing['module']}")
+        logger.info(f"시작 시간 보고서를 저장하였습니다: {report_path}")
+
+
+# --profile-startup이면 아래의 모듈 수준 import부터 기록
+_startup_import_timer = None
+if "--profile-startup" in sys.argv:
+    _startup_import_timer = ImportTimer()
+    _startup_import_timer.install()
+
 import shutil
 import zipfile
-from pathlib import Path
-import gdown
+from pathlib import Path, PureWindowsPath
 import re
-import tempfile
-from tqdm import tqdm
+import html
+from urllib.parse import urljoin
 import os
 import tkinter as tk
 from tkinter import ttk, messagebox
-import vdf
-import threading
-from PIL import Image, ImageTk
-import sys
-import sv_ttk
+import hashlib
+import mmap
+import zlib
+import json
+import io
+import logging
+import logging.handlers
+import collections
+import contextlib
+import argparse
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import winreg
 import ctypes
-import requests
 import webbrowser
-from packaging import version
 
 __version__ = "1.0.3"
 
+logger = logging.getLogger("higurashi_kr_patcher")
+
+# 명령줄 모드 종료 코드
+EXIT_OK = 0
+EXIT_PATCH_FAILED = 1
+EXIT_USAGE_ERROR = 2
+EXIT_STEAM_NOT_FOUND = 3
+EXIT_NOTHING_TO_PATCH = 4
+EXIT_INSUFFICIENT_SPACE = 5
+
+# 첫 창이 표시될 때까지 허용하는 시간 (초)
+STARTUP_BUDGET_SECONDS = 2.0
+
+# 업데이트 확인과 Steam 라이브러리 확인 제한 시간 (초)
+UPDATE_CHECK_TIMEOUT = 5
+STEAM_DISCOVERY_TIMEOUT = 10
+
+# 동시에 진행할 챕터 다운로드 수
+DOWNLOAD_WORKERS = 2
+
+# 캐시 등 프로그램 데이터를 저장할 폴더 이름
+APP_DATA_DIR_NAME = "HigurashiKRPatcher"
+
+# 실행 기록: exe 옆에 순환 로그 파일과 마지막 실행 보고서를 남김
+LOG_FILE_NAME = "kr_patch.log"
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUP_COUNT = 3
+RUN_REPORT_NAME = "kr_patch_run_report.json"
+
+# 패치 파일 캐시 최대 용량 (4 GiB)
+ARCHIVE_CACHE_MAX_BYTES = 4 * 1024**3
+
+# 구글 드라이브 다운로드 주소
+GOOGLE_DRIVE_DOWNLOAD_URL = "https://drive.google.com/uc"
+
+# 다운로드 설정: 한 번에 읽을 크기, 파일 하나를 나누어 받을 구간 수,
+# 구간을 나누기 시작하는 최소 크기, 재시도 횟수와 대기 시간, 연결 제한 시간
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_SEGMENTS = 4
+PARALLEL_DOWNLOAD_MIN_SIZE = 32 * 1024**2
+DOWNLOAD_RETRIES = 5
+DOWNLOAD_BACKOFF_SECONDS = 2
+DOWNLOAD_TIMEOUT = 30
+# 이어받기 정보(.part.json)를 저장하는 최소 간격(초)
+DOWNLOAD_STATE_SAVE_INTERVAL = 1
+
+# --serve 모드 기본 포트와 주소 (같은 네트워크의 다른 PC에서 접속)
+MIRROR_SERVER_PORT = 8765
+MIRROR_SERVER_ADDRESS = "0.0.0.0"
+
+# 다운로드 스케줄러: 전체 속도 제한(0이면 제한 없음), 동시 연결 수, 받는 순서
+DOWNLOAD_RATE_LIMIT = 0
+DOWNLOAD_MAX_CONNECTIONS = DOWNLOAD_WORKERS * DOWNLOAD_SEGMENTS
+DOWNLOAD_ORDERS = ("smallest", "priority", "list")
+DOWNLOAD_ORDER = "smallest"
+# 구글 드라이브가 할당량 초과/요청 제한을 알리면 모든 다운로드를 잠시 멈춤 (초)
+DOWNLOAD_QUOTA_BACKOFF_SECONDS = 30
+DOWNLOAD_QUOTA_BACKOFF_MAX_SECONDS = 600
+# 현재 속도 계산에 사용하는 최근 구간 (초)
+DOWNLOAD_SPEED_WINDOW = 5
+
+# 진행률 이벤트 최소 간격 (초)과 UI가 이벤트 큐를 확인하는 간격 (밀리초)
+PROGRESS_EVENT_INTERVAL = 0.25
+PROGRESS_POLL_INTERVAL_MS = 100
+
+# 챕터 선택 화면에서 한 열에 표시할 체크 버튼 수
+CHAPTERS_PER_COLUMN = 4
+
+# 압축 해제 시 한 번에 기록할 크기 (1 MiB)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Steamgrid 이미지를 동시에 배치할 사용자 폴더 수
+STEAMGRID_WORKERS = 4
+
+# 프로그램 데이터 폴더에 저장하는 Steam 앱 색인 파일
+LIBRARY_INDEX_NAME = "library_index.json"
+
+# 게임 폴더에 기록하는 패치 적용 저널, 원본 백업 파일, 적용 중 원본 보관 폴더, 임시 파일 접미사
+PATCH_JOURNAL_NAME = "kr_patch_journal.json"
+PATCH_BACKUP_NAME = "kr_patch_backup.zip"
+PATCH_STAGING_DIR_NAME = "kr_patch_backup_staging"
+PATCH_TEMP_SUFFIX = ".kr_tmp"
+
+# 무결성 확인: 동시에 해시를 계산할 스레드 수, 한 번에 읽을 크기, 메모리 매핑을 사용할 최소 크기
+VERIFY_WORKERS = min(8, os.cpu_count() or 1)
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+MMAP_HASH_THRESHOLD = 16 * 1024 * 1024
+
+# 압축 해제 작업자 수와 작업 단위 (작은 파일은 묶어서 한 작업으로 처리)
+EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+EXTRACT_BATCH_BYTES = 8 * 1024 * 1024
+EXTRACT_BATCH_FILES = 256
+
+# 한글 패치 적용 상태 표시 문구
+PATCH_STATUS_LABELS = {
+    "installed": "패치 적용됨",
+    "partial": "일부 파일 누락/변경",
+    "outdated": "새 패치 있음",
+    "interrupted": "적용 중단됨",
+    "not_installed": "패치 미적용",
+}
+
+# 게임 폴더에 기록하는 패치 설치 목록 파일
+PATCH_MANIFEST_NAME = "kr_patch_manifest.json"
+PATCH_MANIFEST_VERSION = 1
+
+# 챕터 목록(구글 드라이브 ID, 패치 버전 등)을 새 exe 배포 없이 갱신하기 위한 원격 목록
+CHAPTER_MANIFEST_URL = "https://raw.githubusercontent.com/munsy0227/Higurashi-Auto-KR-Patcher/main/chapters.json"
+CHAPTER_MANIFEST_NAME = "chapters.json"
+CHAPTER_MANIFEST_VERSION = 1
+CHAPTER_MANIFEST_TIMEOUT = 5
+
+# 설치 전 점검: 원격 압축 파일 목록을 읽을 때 한 번에 받는 크기
+REMOTE_ZIP_READ_AHEAD = 64 * 1024
+
+# 이전 실행 기록이 없을 때 예상 시간 계산에 쓰는 속도 (바이트/초)
+DEFAULT_DOWNLOAD_SPEED = 10 * 1024 * 1024
+DEFAULT_APPLY_SPEED = 100 * 1024 * 1024
+THROUGHPUT_HISTORY_NAME = "throughput.json"
+
+# 필요한 공간에 더하는 여유분 (파일 시스템 오버헤드 등)
+DISK_SPACE_MARGIN = 256 * 1024 * 1024
+
+
+# 챕터 정보
+# key는 명령줄 모드에서 챕터를 지정할 때 사용합니다.
+CHAPTERS = [
+    {
+        "key": "onikakushi",
+        "name": "Higurashi When They Cry",
+        "app_id": "310360",
+        "display_name": "오니카쿠시 편 (챕터 1)",
+        "google_drive_id": "1J2FmtLdf72iU0M8PY7WE6L_DVU2ziw3S",
+    },
+    {
+        "key": "watanagashi",
+        "name": "Higurashi 02 - Watanagashi",
+        "app_id": "410890",
+        "display_name": "와타나가시 편 (챕터 2)",
+        "google_drive_id": "1KrEgh4CvKDP4DPulR3GIqGo_Ms1ciCkm",
+    },
+    {
+        "key": "tatarigoroshi",
+        "name": "Higurashi 03 - Tatarigoroshi",
+        "app_id": "472870",
+        "display_name": "타타리고로시 편 (챕터 3)",
+        "google_drive_id": "1XFiYcOQt41s57GKPsLbrC8kblJwHG2D5",
+    },
+    {
+        "key": "himatsubushi",
+        "name": "Higurashi 04 - Himatsubushi",
+        "app_id": "526490",
+        "display_name": "히마츠부시 편 (챕터 4)",
+        "google_drive_id": "1Z6SJLRZO8KkYIQs_C3BVnWfaWWrL4poa",
+    },
+    {
+        "key": "meakashi",
+        "name": "Higurashi When They Cry Hou - Ch. 5 Meakashi",
+        "app_id": "577480",
+        "display_name": "메아카시 편 (챕터 5)",
+        "google_drive_id": "1K25opRd1HtJGWLl9DWzcsvWMKqaZaU_P",
+    },
+    {
+        "key": "tsumihoroboshi",
+        "name": "Higurashi When They Cry Hou - Ch.6 Tsumihoroboshi",
+        "app_id": "668350",
+        "display_name": "츠미호로보시 편 (챕터 6)",
+        "google_drive_id": "1si3l8EYlZFfI8DVtpJT4WAY_I0VEEnEz",
+    },
+    {
+        "key": "minagoroshi",
+        "name": "Higurashi When They Cry Hou - Ch.7 Minagoroshi",
+        "app_id": "1034940",
+        "display_name": "미나고로시 편 (챕터 7)",
+        "google_drive_id": "1AsbW4Oozy76YySHRIQT0sp3rSejryDp8",
+    },
+    {
+        "key": "matsuribayashi",
+        "name": "Higurashi When They Cry Hou - Ch.8 Matsuribayashi",
+        "app_id": "1243670",
+        "display_name": "마츠리바야시 편 (챕터 8)",
+        "google_drive_id": "1si3l8EYlZFfI8DVtpJT4WAY_I0VEEnEz",
+    },
+    {
+        "key": "rei",
+        "name": "Higurashi When They Cry Hou - Rei",
+        "app_id": "1941110",
+        "display_name": "쓰르라미 울 적에 례",
+        "google_drive_id": "13wdP3jz5FvaVi0PBZ_6WsiCK591VkEYS",
+    },
+    {
+        "key": "hou-plus",
+        "name": "Higurashi When They Cry Hou+",
+        "app_id": "2491040",
+        "display_name": "쓰르라미 울 적에 봉+",
+        "google_drive_id": "1kAA5JDB-gFa_mEglHqAvvt8SFV7s3Npb",
+        "special_handling": True,
+    },
+]
+
 
 # 업데이트 확인 함수
-def check_for_updates(current_version):
+def check_for_updates(current_version, timeout=UPDATE_CHECK_TIMEOUT):
     url = "https://api.github.com/repos/munsy0227/Higurashi-Auto-KR-Patcher/releases/latest"
     try:
-        response = requests.get(url)
+        import requests
+        from packaging import version
+
+        response = requests.get(url, timeout=timeout)
         data = response.json()
         latest_version = data.get("tag_name")
         if latest_version is None:
@@ -40,10 +325,89 @@ def check_for_updates(current_version):
         else:
             return False
     except Exception as e:
-        print(f"업데이트 확인 중 오류 발생: {e}")
+        logger.warning(f"업데이트 확인 중 오류 발생: {e}")
         return False
 
 
+# 원격 챕터 목록 형식 확인
+def is_valid_chapter_manifest(manifest):
+    if not isinstance(manifest, dict):
+        return False
+    if manifest.get("version") != CHAPTER_MANIFEST_VERSION:
+        return False
+    chapters = manifest.get("chapters")
+    if not isinstance(chapters, list) or not chapters:
+        return False
+    required_keys = ("key", "name", "app_id", "display_name", "google_drive_id")
+    return all(
+        isinstance(chapter, dict) and all(chapter.get(key) for key in required_keys)
+        for chapter in chapters
+    )
+
+
+# 마지막으로 받은 챕터 목록 읽기 ({"etag": ..., "manifest": ...}, 없으면 None)
+def load_cached_chapter_manifest(cache_path=None):
+    cache_path = cache_path or get_app_data_dir() / CHAPTER_MANIFEST_NAME
+    try:
+        with open(cache_path, "r", encoding="utf-8") as file:
+            cached = json.load(file)
+        if is_valid_chapter_manifest(cached.get("manifest")):
+            return cached
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"저장된 챕터 목록을 읽는 중 오류 발생: {e}")
+    return None
+
+
+# 원격 챕터 목록 가져오기
+# ETag가 같으면(304) 저장된 목록을 그대로 사용하고, 받을 수 없으면 마지막으로 받은 목록을 반환합니다.
+# 사용할 수 있는 목록이 없으면 None을 반환합니다.
+def fetch_chapter_manifest(
+    cache_path=None, url=CHAPTER_MANIFEST_URL, timeout=CHAPTER_MANIFEST_TIMEOUT
+):
+    cache_path = Path(cache_path or get_app_data_dir() / CHAPTER_MANIFEST_NAME)
+    cached = load_cached_chapter_manifest(cache_path)
+    headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else {}
+    try:
+        response = get_http_session().get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and cached:
+            return cached["manifest"]
+        response.raise_for_status()
+        manifest = response.json()
+        if not is_valid_chapter_manifest(manifest):
+            raise ValueError("챕터 목록 형식이 올바르지 않습니다.")
+    except Exception as e:
+        logger.warning(f"챕터 목록을 가져오는 중 오류 발생: {e}")
+        return cached["manifest"] if cached else None
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"etag": response.headers.get("ETag"), "manifest": manifest},
+                file,
+                ensure_ascii=False,
+                indent=2,
+            )
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"챕터 목록을 저장하는 중 오류 발생: {e}")
+    return manifest
+
+
+# 챕터 목록 만들기 (원격 목록이 없으면 프로그램에 포함된 목록 사용)
+def build_chapter_list(manifest=None):
+    if manifest is None:
+        return [dict(chapter) for chapter in CHAPTERS]
+    builtin_chapters = {chapter["key"]: chapter for chapter in CHAPTERS}
+    return [
+        {**builtin_chapters.get(chapter["key"], {}), **chapter}
+        for chapter in manifest["chapters"]
+    ]
+
+
 # Windows 다크 모드 감지 함수
 def is_windows_dark_mode():
     try:
@@ -55,7 +419,7 @@ def is_windows_dark_mode():
         winreg.CloseKey(key)
         return use_light_theme == 0
     except Exception as e:
-        print(f"다크 모드 감지 중 오류 발생: {e}")
+        logger.warning(f"다크 모드 감지 중 오류 발생: {e}")
         return False  # 오류 발생 시 기본적으로 라이트 모드로 간주
 
 
@@ -82,6 +446,8 @@ def get_steam_library_folders(steam_path):
         return []
 
     try:
+        import vdf
+
         with open(library_file, "r", encoding="utf-8") as file:
             data = vdf.load(file)
         libraries = []
@@ -94,323 +460,2908 @@ def get_steam_library_folders(steam_path):
         libraries.append(steam_path)
         return libraries
     except Exception as e:
-        print(f"'libraryfolders.vdf' 파일을 파싱하는 중 오류 발생: {e}")
+        logger.warning(f"'libraryfolders.vdf' 파일을 파싱하는 중 오류 발생: {e}")
         return []
 
 
-# 게임 폴더 이름을 기준으로 설치 경로 확인
-def find_game_install_path_by_name(library_paths, folder_name):
+# Steam 라이브러리의 appmanifest_*.acf를 한 번에 읽어 앱 색인 생성
+# 앱 ID별 설치 폴더 이름(installdir), 설치 경로, 빌드 ID를 기록합니다.
+def build_steam_library_index(library_paths):
+    import vdf
+
+    apps = {}
+    seen_libraries = set()
     for library in library_paths:
-        potential_path = Path(library) / f"steamapps/common/{folder_name}"
-        if potential_path.exists():
-            return potential_path
-    return None
+        # 같은 라이브러리가 다른 표기로 중복될 수 있음
+        library_key = os.path.normcase(os.path.abspath(library))
+        if library_key in seen_libraries:
+            continue
+        seen_libraries.add(library_key)
+
+        steamapps = Path(library) / "steamapps"
+        try:
+            manifests = list(steamapps.glob("appmanifest_*.acf"))
+        except OSError as e:
+            logger.warning(
+                f"라이브러리를 읽는 중 오류 발생: {library}, 오류 메시지: {e}"
+            )
+            continue
+        for manifest in manifests:
+            try:
+                with open(manifest, "r", encoding="utf-8", errors="replace") as file:
+                    data = vdf.load(file)
+            except Exception as e:
+                logger.warning(f"'{manifest.name}' 파일을 파싱하는 중 오류 발생: {e}")
+                continue
+            app_state = next(
+                (value for key, value in data.items() if key.lower() == "appstate"),
+                {},
+            )
+            app_id = app_state.get("appid")
+            install_dir = app_state.get("installdir")
+            if not app_id or not install_dir or app_id in apps:
+                continue
+            apps[app_id] = {
+                "installdir": install_dir,
+                "path": str(steamapps / "common" / install_dir),
+                "buildid": app_state.get("buildid"),
+                "library": str(library),
+            }
+    return {"apps": apps}
 
 
-# Google Drive에서 파일 다운로드
-def download_from_google_drive(file_id, destination, progress_callback=None):
-    url = f"https://drive.google.com/uc?id={file_id}"
+# 앱 색인 불러오기
+# 'libraryfolders.vdf'의 수정 시각이 그대로면 이전에 만든 색인을 재사용합니다.
+def load_steam_library_index(steam_path, library_paths):
+    library_file = Path(steam_path) / "config/libraryfolders.vdf"
+    cache_path = get_app_data_dir() / LIBRARY_INDEX_NAME
     try:
-        gdown.download(url, str(destination), quiet=False)
-    except Exception as e:
-        if progress_callback:
-            progress_callback(f"다운로드 중 문제가 발생하였습니다: {e}")
-        raise e
+        library_mtime_ns = library_file.stat().st_mtime_ns
+    except OSError:
+        library_mtime_ns = None
 
+    if library_mtime_ns is not None:
+        try:
+            with open(cache_path, "r", encoding="utf-8") as file:
+                cached_index = json.load(file)
+            if cached_index.get(
+                "libraryfolders_mtime_ns"
+            ) == library_mtime_ns and cached_index.get("libraries") == list(
+                library_paths
+            ):
+                return cached_index
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"라이브러리 색인을 읽는 중 오류 발생: {e}")
 
-# ZIP 파일 압축 해제
-def extract_zip(zip_path, extract_to, progress_callback=None):
+    library_index = build_steam_library_index(library_paths)
+    library_index["libraryfolders_mtime_ns"] = library_mtime_ns
+    library_index["libraries"] = list(library_paths)
     try:
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(extract_to)
-    except zipfile.BadZipFile:
-        if progress_callback:
-            progress_callback("압축 파일이 손상된 것 같습니다.")
-        raise
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(library_index, file, ensure_ascii=False, indent=2)
+        os.replace(temp_path, cache_path)
     except Exception as e:
-        if progress_callback:
-            progress_callback(f"압축 해제 중 문제가 발생하였습니다: {e}")
-        raise
+        logger.warning(f"라이브러리 색인을 저장하는 중 오류 발생: {e}")
+    return library_index
 
 
-# 리소스 파일 접근을 위한 경로 설정 함수
-def resource_path(relative_path):
-    """PyInstaller로 패키징된 파일 내부의 리소스 경로를 얻습니다."""
-    if hasattr(sys, "_MEIPASS"):
-        # PyInstaller로 패키징된 경우 임시 디렉터리 경로 반환
-        return Path(sys._MEIPASS) / relative_path
-    else:
-        # 일반 Python 스크립트 실행 시
-        return Path(relative_path)
+# 앱 색인에서 챕터의 설치 경로 찾기 (앱 ID 우선, 없으면 폴더 이름으로 확인)
+def find_game_install_path(library_index, chapter):
+    apps = library_index["apps"]
+    app = apps.get(str(chapter.get("app_id")))
+    if app is None:
+        folder_name = chapter["name"].lower()
+        app = next(
+            (app for app in apps.values() if app["installdir"].lower() == folder_name),
+            None,
+        )
+    return Path(app["path"]) if app else None
 
 
-# ZIP 파일을 다운로드하고 압축 해제 및 복사
-def apply_patch_from_zip(
-    file_id, destination, progress_callback=None, special_handling=False
-):
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_dir = Path(temp_dir)
-        zip_path = temp_dir / "patch.zip"
+# 다운로드 오류
+class DownloadError(Exception):
+    pass
 
-        # 1. ZIP 파일 다운로드
-        if progress_callback:
-            progress_callback(
-                "구글 드라이브에서 패치 파일을 가져오는 중입니다. 잠시만 기다려 주시기 바랍니다."
-            )
-        download_from_google_drive(file_id, zip_path, progress_callback)
-        if progress_callback:
-            progress_callback(
-                f"다운로드가 완료되었습니다. 저장된 위치는 다음과 같습니다: {zip_path}"
-            )
 
-        # 2. ZIP 파일 압축 해제
-        if progress_callback:
-            progress_callback("패치 파일을 해제하는 중입니다.")
-        extract_zip(zip_path, temp_dir, progress_callback)
-        if progress_callback:
-            progress_callback(
-                f"압축이 모두 해제되었습니다. 해제된 위치는 다음과 같습니다: {temp_dir}"
-            )
+# 구글 드라이브 다운로드 할당량 초과 또는 요청 제한
+# retry_after는 서버가 Retry-After 헤더로 알려 준 대기 시간(초)입니다.
+class DownloadQuotaError(DownloadError):
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
-        if special_handling:
-            # 동적으로 'Data' 폴더 찾기
-            data_folder = next(
-                (
-                    Path(root) / "Data"
-                    for root, dirs, files in os.walk(temp_dir)
-                    if "Data" in dirs
-                ),
-                None,
-            )
-            if not data_folder:
-                progress_callback(
-                    "패치 파일 내에서 'Data' 폴더를 찾을 수 없어 적용이 불가능합니다."
-                )
-                return False
-            # 모든 파일 복사
-            all_items = [p for p in data_folder.rglob("*") if p.is_file()]
-        else:
-            # 일반 처리: 한글 패치 폴더를 동적으로 찾기
-            korean_patch_folder = next(
-                (
-                    item
-                    for item in temp_dir.iterdir()
-                    if item.is_dir() and "패치" in item.name
-                ),
-                None,
-            )
-            if korean_patch_folder is None:
-                progress_callback(
-                    "'한국어 패치' 폴더를 확인할 수 없어 패치를 적용할 수 없습니다."
-                )
-                return False
-            # 모든 파일 복사
-            all_items = [p for p in korean_patch_folder.rglob("*") if p.is_file()]
 
-        # 5. 총 파일 수를 기반으로 진행률 표시하며 복사
-        progress_callback("패치 파일을 적용하고 있습니다. 잠시만 기다려 주십시오.")
-        for file_path in tqdm(all_items, desc="패치 적용", unit="file"):
-            relative_path = file_path.relative_to(
-                data_folder if special_handling else korean_patch_folder
+# 서버가 구간 다운로드(Range)를 지원하지 않음
+class RangeNotSupportedError(DownloadError):
+    pass
+
+
+# 이어받는 동안 서버의 파일이 바뀜 (전체 크기가 이전 실행과 다름)
+class RemoteFileChangedError(DownloadError):
+    pass
+
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+# 연결을 재사용하는 공용 HTTP 세션 가져오기
+def get_http_session():
+    global _http_session
+    # 연결 풀 크기는 스케줄러의 동시 연결 수에 맞춤 (부족하면 연결을 버리고 다시 맺음)
+    max_connections = get_download_scheduler().max_connections
+    with _http_session_lock:
+        if _http_session is None:
+            import requests
+
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=DOWNLOAD_WORKERS,
+                pool_maxsize=max(DOWNLOAD_MAX_CONNECTIONS, max_connections),
             )
-            target_path = destination / relative_path
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["User-Agent"] = f"Higurashi-Auto-KR-Patcher/{__version__}"
+            _http_session = session
+        return _http_session
 
-            # 대상 디렉터리가 없으면 생성
-            target_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # 파일 복사
+# 다운로드 스케줄러
+# 모든 다운로드 연결이 함께 사용하며, 토큰 버킷으로 전체 속도를 제한하고 동시 연결 수를 제한합니다.
+# 요청 제한 응답을 받으면 모든 연결을 잠시 멈추고, 계속되면 대기 시간을 두 배씩 늘립니다.
+class DownloadScheduler:
+    def __init__(
+        self, rate_limit=DOWNLOAD_RATE_LIMIT, max_connections=DOWNLOAD_MAX_CONNECTIONS
+    ):
+        self.rate_limit = rate_limit
+        self.max_connections = max_connections
+        self._connections = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._tokens = float(rate_limit)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._backoff = 0
+        self._started_at = None
+        self._bytes = 0
+        self._recent = collections.deque()
+        self._active_connections = 0
+        self._throttled_seconds = 0.0
+        self._rate_limited_count = 0
+
+    # 요청 제한으로 멈춘 동안 대기한 뒤 연결 하나를 사용
+    @contextlib.contextmanager
+    def connection(self):
+        while True:
+            with self._lock:
+                delay = self._paused_until - time.monotonic()
+            if delay <= 0:
+                break
+            time.sleep(delay)
+        with self._connections:
+            with self._lock:
+                self._active_connections += 1
             try:
-                shutil.copy2(file_path, target_path)
-            except Exception as e:
-                progress_callback(
-                    f"파일 복사 중 문제가 발생하였습니다: {file_path} -> {target_path}\n오류: {e}"
+                yield
+            finally:
+                with self._lock:
+                    self._active_connections -= 1
+
+    # 받은 데이터 양을 기록하고, 속도 제한을 넘으면 그만큼 대기
+    def consume(self, byte_count):
+        now = time.monotonic()
+        with self._lock:
+            if self._started_at is None:
+                self._started_at = now
+            self._bytes += byte_count
+            self._recent.append((now, byte_count))
+            while self._recent and now - self._recent[0][0] > DOWNLOAD_SPEED_WINDOW:
+                self._recent.popleft()
+            delay = 0.0
+            if self.rate_limit:
+                # 최대 1초 분량까지 모아 둘 수 있음
+                self._tokens = min(
+                    self.rate_limit,
+                    self._tokens + (now - self._last_refill) * self.rate_limit,
                 )
-        progress_callback(
-            f"패치가 완료되었습니다. 적용된 경로는 다음과 같습니다: {destination}"
-        )
-        return True  # 패치 성공
+                self._last_refill = now
+                self._tokens -= byte_count
+                if self._tokens < 0:
+                    delay = -self._tokens / self.rate_limit
+                    self._throttled_seconds += delay
+        if delay:
+            time.sleep(delay)
 
+    # 요청 제한 응답을 받으면 모든 연결을 멈출 시간을 정하고 대기 시간(초)을 반환
+    def report_rate_limited(self, retry_after=None):
+        with self._lock:
+            self._backoff = min(
+                self._backoff * 2 or DOWNLOAD_QUOTA_BACKOFF_SECONDS,
+                DOWNLOAD_QUOTA_BACKOFF_MAX_SECONDS,
+            )
+            delay = retry_after or self._backoff
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            self._rate_limited_count += 1
+            return delay
 
-# Steamgrid 이미지 적용
-def apply_steamgrid_images(steam_path):
-    # 사용자 데이터 경로
-    user_data_dir = Path(steam_path) / "userdata"
-    steamgrid_source = resource_path("Steamgrid")
+    def report_success(self):
+        with self._lock:
+            self._backoff = 0
 
-    if not steamgrid_source.exists():
-        print(f"Error: Steamgrid 이미지를 찾을 수 없습니다. 경로: {steamgrid_source}")
-        return
+    # 속도 제한 조정에 사용할 통계
+    def stats(self):
+        now = time.monotonic()
+        with self._lock:
+            elapsed = now - self._started_at if self._started_at else 0.0
+            recent_bytes = sum(
+                byte_count
+                for received_at, byte_count in self._recent
+                if now - received_at <= DOWNLOAD_SPEED_WINDOW
+            )
+            return {
+                "bytes": self._bytes,
+                "seconds": elapsed,
+                "average_speed": self._bytes / elapsed if elapsed > 0 else 0.0,
+                "current_speed": (
+                    recent_bytes / min(DOWNLOAD_SPEED_WINDOW, elapsed)
+                    if elapsed > 0
+                    else 0.0
+                ),
+                "rate_limit": self.rate_limit,
+                "active_connections": self._active_connections,
+                "max_connections": self.max_connections,
+                "throttled_seconds": self._throttled_seconds,
+                "rate_limited_count": self._rate_limited_count,
+            }
 
-    # 각 사용자의 Steamgrid 이미지 경로에 이미지 복사
-    for user_dir in user_data_dir.iterdir():
-        if user_dir.is_dir():
-            grid_destination = user_dir / "config" / "grid"
-            grid_destination.mkdir(parents=True, exist_ok=True)
 
-            for image_file in steamgrid_source.glob("*.*"):
-                target_image_path = grid_destination / image_file.name
-                try:
-                    shutil.copy2(image_file, target_image_path)
-                except Exception as e:
-                    print(
-                        f"이미지 복사 중 오류 발생: {image_file} -> {target_image_path}, 오류 메시지: {e}"
-                    )
+_download_scheduler = None
+_download_scheduler_lock = threading.Lock()
 
-    print(
-        f"모든 Steamgrid 이미지가 해당 경로에 복사되었습니다: {user_data_dir}/config/grid"
-    )
 
+# 기본 다운로드 스케줄러 가져오기
+def get_download_scheduler():
+    global _download_scheduler
+    with _download_scheduler_lock:
+        if _download_scheduler is None:
+            _download_scheduler = DownloadScheduler()
+        return _download_scheduler
 
-# GUI 설정
-class PatchInstallerUI:
-    def __init__(self, root, chapters, library_paths):
-        self.root = root
-        self.root.title("쓰르라미 울 적에 한글 패치 마법사")
-        self.root.geometry("750x500")  # 창 크기 조정
-        self.library_paths = library_paths
 
-        # 다크 모드 여부 감지
-        self.is_dark_mode = is_windows_dark_mode()
+# 다운로드 시작 전에 속도 제한과 동시 연결 수 설정
+def configure_download_scheduler(
+    rate_limit=DOWNLOAD_RATE_LIMIT, max_connections=DOWNLOAD_MAX_CONNECTIONS
+):
+    global _download_scheduler, _http_session
+    with _download_scheduler_lock:
+        _download_scheduler = DownloadScheduler(rate_limit, max_connections)
+        scheduler = _download_scheduler
+    # 이미 만든 세션은 연결 풀 크기가 맞지 않을 수 있으므로 다음 사용 때 새로 만듦
+    with _http_session_lock:
+        _http_session = None
+    return scheduler
 
-        # Sun Valley 테마 적용
-        sv_ttk.set_theme("dark" if self.is_dark_mode else "light")
 
-        # 아이콘 설정
-        icon_path = resource_path("ICO.ico")
+# 요청 제한 응답을 받으면 스케줄러에 알려 모든 연결을 멈춘 뒤 다시 시도
+# 대기는 다음 요청이 연결을 얻을 때 처리됩니다.
+def call_with_quota_backoff(func, *args, retries=DOWNLOAD_RETRIES, scheduler=None):
+    scheduler = scheduler or get_download_scheduler()
+    for attempt in range(retries + 1):
         try:
-            # 작업표시줄 아이콘 적용을 위해 PhotoImage 사용
-            icon_img = ImageTk.PhotoImage(file=icon_path)
-            self.root.iconphoto(False, icon_img)
-        except Exception as e:
-            print(f"아이콘 설정 중 오류 발생: {e}")
-
-        # 기본 폰트 설정 (맑은 고딕 사용)
-        self.custom_font = ("맑은 고딕", 12)
+            return func(*args)
+        except DownloadQuotaError as e:
+            if attempt == retries:
+                raise
+            delay = scheduler.report_rate_limited(e.retry_after)
+            logger.warning(
+                f"다운로드 요청이 제한되어 {delay}초 후 다시 시도합니다: {e}"
+            )
 
-        # ttk 스타일에 기본 폰트 적용
-        style = ttk.Style()
-        style.configure(".", font=self.custom_font)
-        style.configure("TLabel", font=self.custom_font)
-        style.configure("TButton", font=self.custom_font)
-        style.configure("TCheckbutton", font=self.custom_font)
 
-        self.selected_chapters = []
-        self.chapters = chapters
+# 다운로드 응답 상태 확인
+def raise_for_download_status(response):
+    if response.status_code == 429 or (
+        response.status_code == 403 and "quota" in response.text.lower()
+    ):
+        retry_after = response.headers.get("Retry-After", "")
+        raise DownloadQuotaError(
+            f"다운로드 요청이 제한되었습니다. (HTTP {response.status_code})",
+            int(retry_after) if retry_after.isdigit() else None,
+        )
+    if response.status_code >= 400:
+        raise DownloadError(
+            f"서버가 오류를 반환하였습니다. (HTTP {response.status_code})"
+        )
 
-        # 이미지 추가 (이미지 크기 조정 포함)
-        try:
-            image_path = resource_path("IMG.png")
-            self.header_image = Image.open(image_path)
-            # 이미지 크기 조정 (너무 크다면 줄여줌)
-            self.header_image = self.header_image.resize((500, 163), Image.LANCZOS)
-            self.header_image_tk = ImageTk.PhotoImage(self.header_image)
 
-            # 이미지 레이블 생성
-            header_label = tk.Label(self.root, image=self.header_image_tk)
-            header_label.pack(pady=10)
-        except Exception as e:
-            print(f"이미지 로드 중 오류 발생: {e}")
+# 이어받기 정보 읽기
+def load_download_state(state_path, resume_key):
+    try:
+        with open(state_path, "r", encoding="utf-8") as file:
+            state = json.load(file)
+        if state.get("resume_key") == resume_key:
+            return state
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"이어받기 정보를 읽는 중 오류 발생: {e}")
+    return None
 
-        self.create_widgets()
 
-    def create_widgets(self):
-        # 제목 레이블
-        title_label = ttk.Label(
-            self.root,
-            text="어떤 챕터에 패치를 적용할지 선택해 주십시오.",
-            justify="center",
-        )
-        title_label.pack(pady=10)
+# 이어받기 정보 저장
+def save_download_state(state_path, state):
+    temp_path = state_path.with_suffix(".tmp")
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(state, file)
+    os.replace(temp_path, state_path)
 
-        # 체크 버튼 목록 (세 개의 열로 나눔)
-        self.chapter_vars = []
 
-        # 체크 버튼들을 담을 프레임을 중앙에 배치
-        main_frame = ttk.Frame(self.root)
-        main_frame.pack(pady=20)
+# 파일 크기와 구간 다운로드(Range) 지원 여부 확인
+def probe_download(session, url, params=None, scheduler=None):
+    scheduler = scheduler or get_download_scheduler()
+    with scheduler.connection(), session.get(
+        url,
+        params=params,
+        headers={"Range": "bytes=0-0"},
+        stream=True,
+        timeout=DOWNLOAD_TIMEOUT,
+    ) as response:
+        raise_for_download_status(response)
+        if response.status_code == 206:
+            content_range = response.headers.get("Content-Range", "")
+            total = content_range.rpartition("/")[2]
+            if total.isdigit():
+                return int(total), True
+        content_length = response.headers.get("Content-Length")
+        return (int(content_length) if content_length else None), False
 
-        # 첫 번째 열 (첫 4개 챕터)
-        first_column_frame = ttk.Frame(main_frame)
-        first_column_frame.grid(row=0, column=0, padx=20, sticky="n")
 
-        for idx in range(4):
-            var = tk.BooleanVar(value=self.chapters[idx].get("installed", False))
-            self.chapter_vars.append(var)
-            chk = ttk.Checkbutton(
-                first_column_frame,
-                text=self.chapters[idx]["display_name"],
-                variable=var,
-            )
-            chk.pack(anchor="w")
+# 한 구간을 .part 파일의 제자리에 받기 (중단되면 받은 위치부터 이어받기)
+# segment는 {"start", "end", "done"}이며, 받은 바이트 수(done)를 갱신하고 checkpoint()로 저장합니다.
+def download_range(
+    session,
+    url,
+    params,
+    part_path,
+    segment,
+    progress,
+    retries=DOWNLOAD_RETRIES,
+    scheduler=None,
+    total=None,
+    checkpoint=None,
+):
+    import requests
 
-        # 두 번째 열 (다음 4개 챕터)
-        second_column_frame = ttk.Frame(main_frame)
-        second_column_frame.grid(row=0, column=1, padx=20, sticky="n")
+    scheduler = scheduler or get_download_scheduler()
+    start, end = segment["start"], segment["end"]
+    for attempt in range(retries + 1):
+        offset = segment["done"]
+        expected_size = None if end is None else end - start + 1
+        if expected_size is not None and offset >= expected_size:
+            return
 
-        for idx in range(4, 8):
-            var = tk.BooleanVar(value=self.chapters[idx].get("installed", False))
-            self.chapter_vars.append(var)
-            chk = ttk.Checkbutton(
-                second_column_frame,
-                text=self.chapters[idx]["display_name"],
-                variable=var,
-            )
-            chk.pack(anchor="w")
+        headers = {}
+        if start + offset > 0 or end is not None:
+            headers["Range"] = f"bytes={start + offset}-{'' if end is None else end}"
+        try:
+            with scheduler.connection(), session.get(
+                url,
+                params=params,
+                headers=headers,
+                stream=True,
+                timeout=DOWNLOAD_TIMEOUT,
+            ) as response:
+                raise_for_download_status(response)
+                if response.status_code != 206 and "Range" in headers:
+                    # 서버가 Range를 무시하면 처음부터 다시 받음
+                    if start > 0:
+                        raise RangeNotSupportedError(
+                            "서버가 구간 다운로드를 지원하지 않습니다."
+                        )
+                    progress(-offset)
+                    offset = segment["done"] = 0
+                    content_length = response.headers.get("Content-Length")
+                    expected_size = int(content_length) if content_length else None
+                elif expected_size is None:
+                    content_length = response.headers.get("Content-Length")
+                    if content_length:
+                        expected_size = offset + int(content_length)
+                if response.status_code == 206 and total is not None:
+                    # 다른 파일의 구간을 이어 붙이지 않도록 전체 크기 확인
+                    remote_total = response.headers.get("Content-Range", "")
+                    remote_total = remote_total.rpartition("/")[2]
+                    if remote_total.isdigit() and int(remote_total) != total:
+                        raise RemoteFileChangedError(
+                            "이어받는 동안 서버의 파일이 바뀌었습니다."
+                        )
 
-        # 세 번째 열 (나머지 챕터)
-        third_column_frame = ttk.Frame(main_frame)
-        third_column_frame.grid(row=0, column=2, padx=20, sticky="n")
+                with open(part_path, "r+b") as file:
+                    file.seek(start + offset)
+                    # 크기를 모르는 단일 구간은 이전에 받은 뒷부분을 버림
+                    if end is None:
+                        file.truncate()
+                    for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                        file.write(chunk)
+                        offset += len(chunk)
+                        segment["done"] = offset
+                        progress(len(chunk))
+                        scheduler.consume(len(chunk))
+                        if checkpoint:
+                            checkpoint()
 
-        for idx in range(8, len(self.chapters)):
-            var = tk.BooleanVar(value=self.chapters[idx].get("installed", False))
-            self.chapter_vars.append(var)
-            chk = ttk.Checkbutton(
-                third_column_frame,
-                text=self.chapters[idx]["display_name"],
-                variable=var,
+            if expected_size is not None and offset < expected_size:
+                raise DownloadError(
+                    f"전송이 중간에 끊어졌습니다. ({offset}/{expected_size} 바이트)"
+                )
+            scheduler.report_success()
+            return
+        except (RangeNotSupportedError, RemoteFileChangedError):
+            raise
+        except DownloadQuotaError as e:
+            if attempt == retries:
+                raise
+            # 다른 연결도 함께 멈추도록 스케줄러에 알리고, 다음 연결 시 대기
+            delay = scheduler.report_rate_limited(e.retry_after)
+            logger.warning(
+                f"다운로드 요청이 제한되어 {delay}초 후 다시 시도합니다: {e}"
             )
-            chk.pack(anchor="w")
+        except (requests.RequestException, DownloadError) as e:
+            if attempt == retries:
+                raise
+            delay = DOWNLOAD_BACKOFF_SECONDS * 2**attempt
+            logger.warning(
+                f"다운로드 재시도 ({attempt + 1}/{retries}), {delay}초 후: {e}"
+            )
+            time.sleep(delay)
 
-        # 진행 상태 표시 레이블
-        self.status_label = ttk.Label(self.root, text="")
-        self.status_label.pack(pady=20)
 
-        # 설치 버튼
-        install_btn = ttk.Button(
-            self.root, text="한글 패치 설치", command=self.start_installation_thread
+# 이어받기와 병렬 구간 다운로드를 지원하는 파일 다운로드
+# 전체 크기로 미리 만든 .part 파일 하나에 구간마다 제 위치에 기록하고, 구간별 진행 상황은
+# .part.json에 남겨 다음 실행에서 이어받습니다. 다 받으면 이름만 바꾸므로 파일을 다시 복사하지 않습니다.
+# progress_hook(받은 바이트, 전체 바이트)로 진행 상황을 알립니다.
+def download_file(
+    url,
+    destination,
+    params=None,
+    session=None,
+    progress_hook=None,
+    resume_key=None,
+    segments=DOWNLOAD_SEGMENTS,
+    scheduler=None,
+):
+    destination = Path(destination)
+    session = session or get_http_session()
+    scheduler = scheduler or get_download_scheduler()
+    resume_key = resume_key or url
+    state_path = destination.with_name(destination.name + ".part.json")
+    part_path = destination.with_name(destination.name + ".part")
+
+    state = load_download_state(state_path, resume_key)
+    # 이전 형식의 정보이거나 받던 파일이 없으면 처음부터 받음
+    if state is not None and (
+        not part_path.exists()
+        or len(state.get("done", [])) != len(state.get("ranges", []))
+    ):
+        state = None
+    resumed = state is not None
+    if state is None:
+        total, accepts_ranges = call_with_quota_backoff(
+            probe_download, session, url, params, scheduler, scheduler=scheduler
         )
-        install_btn.pack(pady=10)
+        if accepts_ranges and segments > 1 and total >= PARALLEL_DOWNLOAD_MIN_SIZE:
+            # 큰 파일은 여러 구간으로 나누어 동시에 받음
+            segment_size = -(-total // segments)
+            ranges = [
+                [start, min(start + segment_size, total) - 1]
+                for start in range(0, total, segment_size)
+            ]
+        else:
+            ranges = [[0, total - 1 if total and accepts_ranges else None]]
+        state = {
+            "resume_key": resume_key,
+            "size": total,
+            "ranges": ranges,
+            "done": [0] * len(ranges),
+        }
+        # 이전 버전이 남긴 구간별 파일(.part0, .part1 ...) 정리
+        for legacy_path in destination.parent.glob(f"{destination.name}.part[0-9]*"):
+            legacy_path.unlink(missing_ok=True)
+        # 전체 크기를 알면 미리 그 크기로 만들어 두고 구간마다 제자리에 기록
+        with open(part_path, "wb") as file:
+            if total and accepts_ranges:
+                file.truncate(total)
+        save_download_state(state_path, state)
 
-    def update_status(self, message):
-        self.status_label.config(text=message)
-        self.root.update_idletasks()
+    total = state["size"]
+    segment_states = [
+        {"start": start, "end": end, "done": done}
+        for (start, end), done in zip(state["ranges"], state["done"])
+    ]
+    received = sum(state["done"])
+    progress_lock = threading.Lock()
+    last_saved_at = time.monotonic()
 
-    def start_installation_thread(self):
-        # 설치 작업을 별도의 스레드에서 실행
-        install_thread = threading.Thread(target=self.start_installation)
-        install_thread.start()
+    def progress(byte_count):
+        nonlocal received
+        with progress_lock:
+            received += byte_count
+            if progress_hook:
+                progress_hook(received, total)
 
-    def start_installation(self):
-        # 선택된 챕터 수집
-        self.selected_chapters = [
-            self.chapters[idx] for idx, var in enumerate(self.chapter_vars) if var.get()
-        ]
+    # 구간별로 받은 바이트 수를 .part.json에 저장 (자주 쓰지 않도록 간격을 둠)
+    def checkpoint(force=False):
+        nonlocal last_saved_at
+        with progress_lock:
+            now = time.monotonic()
+            if not force and now - last_saved_at < DOWNLOAD_STATE_SAVE_INTERVAL:
+                return
+            last_saved_at = now
+            state["done"] = [segment["done"] for segment in segment_states]
+            save_download_state(state_path, state)
 
-        if not self.selected_chapters:
-            messagebox.showwarning(
-                "경고",
-                "설치할 챕터를 선택하지 않으셨습니다. 챕터를 선택해 주시기 바랍니다.",
+    try:
+        if len(segment_states) == 1:
+            download_range(
+                session,
+                url,
+                params,
+                part_path,
+                segment_states[0],
+                progress,
+                scheduler=scheduler,
+                total=total,
+                checkpoint=checkpoint,
             )
-            return
-
-        # 패치 설치 시작
-        patched_chapters = []
+        else:
+            with ThreadPoolExecutor(
+                max_workers=len(segment_states), thread_name_prefix="segment"
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        download_range,
+                        session,
+                        url,
+                        params,
+                        part_path,
+                        segment,
+                        progress,
+                        scheduler=scheduler,
+                        total=total,
+                        checkpoint=checkpoint,
+                    )
+                    for segment in segment_states
+                ]
+                for future in futures:
+                    future.result()
+    except RemoteFileChangedError:
+        # 이전 실행에서 받은 구간은 버리고 처음부터 다시 받음
+        part_path.unlink(missing_ok=True)
+        state_path.unlink(missing_ok=True)
+        if not resumed:
+            raise
+        logger.warning(f"서버의 파일이 바뀌어 처음부터 다시 받습니다: {url}")
+        return download_file(
+            url,
+            destination,
+            params,
+            session,
+            progress_hook,
+            resume_key,
+            segments,
+            scheduler,
+        )
+    except BaseException:
+        # 다음 실행에서 이어받을 수 있도록 받은 만큼 기록
+        checkpoint(force=True)
+        raise
+
+    os.replace(part_path, destination)
+    state_path.unlink(missing_ok=True)
+
+    if total is not None and destination.stat().st_size != total:
+        destination.unlink()
+        raise DownloadError("받은 파일의 크기가 올바르지 않습니다.")
+    return destination
+
+
+# 구글 드라이브의 실제 다운로드 주소 확인
+# 용량이 큰 파일은 바이러스 검사 경고 페이지의 확인 폼을 거쳐야 받을 수 있습니다.
+def resolve_google_drive_download(session, file_id, base_url=GOOGLE_DRIVE_DOWNLOAD_URL):
+    url = base_url
+    params = {"export": "download", "id": file_id}
+    for _ in range(3):
+        with get_download_scheduler().connection(), session.get(
+            url, params=params, stream=True, timeout=DOWNLOAD_TIMEOUT
+        ) as response:
+            raise_for_download_status(response)
+            if "text/html" not in response.headers.get("Content-Type", ""):
+                return response.url
+            page_url = response.url
+            page = response.text
+
+        # 확인 폼(download-form)의 주소와 숨은 입력값으로 다시 요청
+        form = re.search(r"<form[^>]*download-form[^>]*>", page)
+        if form:
+            action = re.search(r'action="([^"]+)"', form.group(0))
+            if action:
+                url = urljoin(page_url, html.unescape(action.group(1)))
+                params = {
+                    name: html.unescape(value)
+                    for name, value in re.findall(
+                        r'<input[^>]*type="hidden"[^>]*name="([^"]+)"[^>]*value="([^"]*)"',
+                        page,
+                    )
+                }
+                continue
+
+        # 이전 방식: 쿠키나 링크에 담긴 confirm 토큰
+        confirm = next(
+            (
+                value
+                for name, value in session.cookies.items()
+                if name.startswith("download_warning")
+            ),
+            None,
+        )
+        if confirm is None:
+            match = re.search(r"confirm=([0-9A-Za-z_-]+)", page)
+            confirm = match.group(1) if match else None
+        if confirm:
+            params = {"export": "download", "id": file_id, "confirm": confirm}
+            continue
+
+        if "quota" in page.lower() or "too many users" in page.lower():
+            raise DownloadQuotaError(
+                "구글 드라이브 다운로드 할당량을 초과하였습니다. 잠시 후 다시 시도해 주십시오."
+            )
+        break
+    raise DownloadError("구글 드라이브 다운로드 주소를 확인할 수 없습니다.")
+
+
+# Google Drive에서 파일 다운로드
+# progress_hook(받은 바이트, 전체 바이트)로 진행 상황을 알립니다.
+# session과 base_url을 바꾸면 확인 토큰 처리를 로컬 서버로 시험할 수 있습니다.
+def download_from_google_drive(
+    file_id,
+    destination,
+    progress_callback=None,
+    progress_hook=None,
+    session=None,
+    base_url=GOOGLE_DRIVE_DOWNLOAD_URL,
+):
+    session = session or get_http_session()
+    try:
+        url = call_with_quota_backoff(
+            resolve_google_drive_download, session, file_id, base_url
+        )
+        download_file(
+            url,
+            destination,
+            session=session,
+            progress_hook=progress_hook,
+            resume_key=file_id,
+        )
+    except Exception as e:
+        if progress_callback:
+            progress_callback(f"다운로드 중 문제가 발생하였습니다: {e}")
+        raise e
+
+
+# HTTP Range 요청으로 원격 파일의 필요한 부분만 읽는 파일 객체
+# zipfile에 넘기면 파일 끝의 중앙 디렉터리만 받아 압축 파일 목록을 확인할 수 있습니다.
+class HttpRangeReader(io.RawIOBase):
+    def __init__(self, session, url, size, read_ahead=REMOTE_ZIP_READ_AHEAD):
+        self.session = session
+        self.url = url
+        self.size = size
+        self.read_ahead = read_ahead
+        self._position = 0
+        self._buffer_start = 0
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self._position = max(0, min(offset, self.size))
+        return self._position
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.size - self._position
+        end = min(self._position + size, self.size)
+        if end <= self._position:
+            return b""
+        buffer_end = self._buffer_start + len(self._buffer)
+        if not (self._buffer_start <= self._position and end <= buffer_end):
+            fetch_end = min(max(end, self._position + self.read_ahead), self.size)
+            with get_download_scheduler().connection(), self.session.get(
+                self.url,
+                headers={"Range": f"bytes={self._position}-{fetch_end - 1}"},
+                timeout=DOWNLOAD_TIMEOUT,
+            ) as response:
+                raise_for_download_status(response)
+                if response.status_code != 206:
+                    raise RangeNotSupportedError(
+                        "서버가 이어받기(Range 요청)를 지원하지 않습니다."
+                    )
+                self._buffer = response.content
+            self._buffer_start = self._position
+        offset = self._position - self._buffer_start
+        data = self._buffer[offset : offset + end - self._position]
+        self._position += len(data)
+        return data
+
+
+# 작업 스레드별 ZipFile 핸들
+# ZipFile 하나를 여러 스레드가 같이 읽으면 서로 잠금을 기다리므로 스레드마다 따로 엽니다.
+class ZipHandlePool:
+    def __init__(self, zip_path):
+        self.zip_path = zip_path
+        self._local = threading.local()
+        self._handles = []
+        self._lock = threading.Lock()
+
+    def get(self):
+        zip_handle = getattr(self._local, "zip_ref", None)
+        if zip_handle is None:
+            zip_handle = self._local.zip_ref = zipfile.ZipFile(self.zip_path, "r")
+            with self._lock:
+                self._handles.append(zip_handle)
+        return zip_handle
+
+    def close(self):
+        with self._lock:
+            handles, self._handles = self._handles, []
+        for zip_handle in handles:
+            zip_handle.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# 폴더를 얕은 경로부터 한 번씩만 생성
+def make_directories(directories):
+    for directory in sorted(set(directories), key=lambda path: len(path.parts)):
+        directory.mkdir(parents=True, exist_ok=True)
+
+
+# 압축 파일 목록을 작업 단위로 나누기
+# 큰 파일은 하나씩, 작은 파일은 EXTRACT_BATCH_BYTES/EXTRACT_BATCH_FILES 단위로 묶고 큰 작업부터 처리합니다.
+# members는 (ZipInfo, 대상 경로) 목록입니다.
+def plan_extract_batches(members):
+    batches = []
+    batch, batch_bytes = [], 0
+    for member in members:
+        info = member[0]
+        if info.file_size >= EXTRACT_BATCH_BYTES:
+            batches.append((info.file_size, [member]))
+            continue
+        batch.append(member)
+        batch_bytes += info.file_size
+        if batch_bytes >= EXTRACT_BATCH_BYTES or len(batch) >= EXTRACT_BATCH_FILES:
+            batches.append((batch_bytes, batch))
+            batch, batch_bytes = [], 0
+    if batch:
+        batches.append((batch_bytes, batch))
+    batches.sort(key=lambda item: item[0], reverse=True)
+    return [batch for _, batch in batches]
+
+
+# ZIP 파일 압축 해제
+# 작업자마다 별도의 ZipFile 핸들을 열어 여러 코어에서 동시에 압축을 풉니다.
+# 처리한 파일 수, 바이트 수, 소요 시간, 처리 속도를 반환합니다.
+def extract_zip(
+    zip_path,
+    extract_to,
+    progress_callback=None,
+    max_workers=EXTRACT_WORKERS,
+    progress_hook=None,
+):
+    extract_to = Path(extract_to)
+    started_at = time.perf_counter()
+    try:
+        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            members = []
+            resolved_root = extract_to.resolve()
+            for info in zip_ref.infolist():
+                member_name = decode_member_name(info)
+                target_path = resolve_member_path(
+                    extract_to, member_name, resolved_root
+                )
+                # 대상 폴더 밖을 가리키는 경로는 건너뜀
+                if target_path is None:
+                    if progress_callback:
+                        progress_callback(
+                            f"잘못된 경로가 포함되어 건너뛰었습니다: {member_name}"
+                        )
+                    continue
+                members.append((info, target_path))
+
+        # 폴더 구조는 작업 시작 전에 한 번만 생성
+        directories = {extract_to}
+        for info, target_path in members:
+            directories.add(target_path if info.is_dir() else target_path.parent)
+        make_directories(directories)
+        members = [
+            (info, target_path) for info, target_path in members if not info.is_dir()
+        ]
+
+        total_bytes = sum(info.file_size for info, _ in members)
+        done_files = 0
+        done_bytes = 0
+        progress_lock = threading.Lock()
+        zip_handles = ZipHandlePool(zip_path)
+
+        def extract_batch(batch):
+            nonlocal done_files, done_bytes
+            zip_handle = zip_handles.get()
+            for info, target_path in batch:
+                with zip_handle.open(info) as source, open(target_path, "wb") as target:
+                    shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
+            with progress_lock:
+                done_files += len(batch)
+                done_bytes += sum(info.file_size for info, _ in batch)
+                if progress_hook:
+                    progress_hook(done_files, len(members), done_bytes, total_bytes)
+
+        with zip_handles, ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="extract"
+        ) as executor:
+            # 첫 오류를 그대로 전달
+            for _ in executor.map(extract_batch, plan_extract_batches(members)):
+                pass
+    except zipfile.BadZipFile:
+        if progress_callback:
+            progress_callback("압축 파일이 손상된 것 같습니다.")
+        raise
+    except Exception as e:
+        if progress_callback:
+            progress_callback(f"압축 해제 중 문제가 발생하였습니다: {e}")
+        raise
+
+    seconds = time.perf_counter() - started_at
+    stats = {
+        "files": len(members),
+        "bytes": total_bytes,
+        "seconds": seconds,
+        "throughput": total_bytes / seconds if seconds > 0 else 0,
+    }
+    get_run_report().record("extract", seconds, files=len(members), bytes=total_bytes)
+    if progress_callback:
+        progress_callback(
+            f"압축 해제가 완료되었습니다: {stats['files']}개 파일, "
+            f"{format_bytes(total_bytes)} ({format_bytes(stats['throughput'])}/s)"
+        )
+    return stats
+
+
+# 리소스 파일 접근을 위한 경로 설정 함수
+def resource_path(relative_path):
+    """PyInstaller로 패키징된 파일 내부의 리소스 경로를 얻습니다."""
+    if hasattr(sys, "_MEIPASS"):
+        # PyInstaller로 패키징된 경우 임시 디렉터리 경로 반환
+        return Path(sys._MEIPASS) / relative_path
+    else:
+        # 일반 Python 스크립트 실행 시
+        return Path(relative_path)
+
+
+# 프로그램 데이터(캐시 등)를 저장할 경로
+def get_app_data_dir():
+    base_dir = os.environ.get("LOCALAPPDATA")
+    if base_dir:
+        return Path(base_dir) / APP_DATA_DIR_NAME
+    return Path.home() / f".{APP_DATA_DIR_NAME}"
+
+
+# 로그와 실행 보고서를 저장할 경로 (PyInstaller로 패키징된 경우 exe가 있는 폴더)
+# 쓸 수 없는 폴더(Program Files 등)이면 프로그램 데이터 폴더를 사용합니다.
+def get_log_dir():
+    if getattr(sys, "frozen", False):
+        log_dir = Path(sys.executable).parent
+    else:
+        log_dir = Path(__file__).resolve().parent
+    try:
+        with open(log_dir / LOG_FILE_NAME, "a", encoding="utf-8"):
+            pass
+        return log_dir
+    except OSError:
+        fallback_dir = get_app_data_dir() / "logs"
+        fallback_dir.mkdir(parents=True, exist_ok=True)
+        return fallback_dir
+
+
+# 로그 설정
+# 창 모드로 패키징하면 콘솔이 없으므로, 모든 메시지를 순환 로그 파일에 기록합니다.
+def setup_logging(log_dir=None, console=True):
+    log_dir = Path(log_dir) if log_dir else get_log_dir()
+    formatter = logging.Formatter(
+        "%(asctime)s %(levelname)s [%(threadName)s] %(message)s"
+    )
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_dir / LOG_FILE_NAME,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(formatter)
+    logger.addHandler(file_handler)
+    # 창 모드 exe에서는 sys.stderr가 None
+    if console and sys.stderr is not None:
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(console_handler)
+    logger.setLevel(logging.INFO)
+    logger.info(f"쓰르라미 울 적에 한글 패치 {__version__} 시작")
+    return log_dir
+
+
+# 실행 보고서
+# 단계별(업데이트 확인, 라이브러리 확인, 챕터별 다운로드/적용, Steamgrid 등) 소요 시간과
+# 바이트 수, 파일 수를 모아 로그에 남기고 JSON 보고서로 저장합니다.
+class RunReport:
+    def __init__(self):
+        self.started_at = time.time()
+        self.stages = []
+        self._lock = threading.Lock()
+
+    # with 블록의 소요 시간을 기록 (블록 안에서 metrics에 바이트 수 등을 추가)
+    @contextlib.contextmanager
+    def stage(self, name, chapter=None, **metrics):
+        started_at = time.perf_counter()
+        status = "ok"
+        try:
+            yield metrics
+        except BaseException:
+            status = "failed"
+            raise
+        finally:
+            self.record(
+                name,
+                time.perf_counter() - started_at,
+                chapter,
+                status=status,
+                **metrics,
+            )
+
+    def record(self, name, seconds, chapter=None, **metrics):
+        entry = {"stage": name, "chapter": chapter, "seconds": seconds, **metrics}
+        with self._lock:
+            self.stages.append(entry)
+        logger.info(
+            f"[단계] {name} {chapter or '-'} {seconds:.3f}초 "
+            + json.dumps(metrics, ensure_ascii=False, default=str)
+        )
+
+    # 단계별 합계
+    def totals(self):
+        totals = {}
+        with self._lock:
+            stages = list(self.stages)
+        for entry in stages:
+            total = totals.setdefault(
+                entry["stage"], {"count": 0, "seconds": 0.0, "bytes": 0, "files": 0}
+            )
+            total["count"] += 1
+            total["seconds"] += entry["seconds"]
+            total["bytes"] += entry.get("bytes") or 0
+            total["files"] += entry.get("files") or 0
+        return totals
+
+    def write(self, report_path):
+        with self._lock:
+            stages = list(self.stages)
+        report = {
+            "version": __version__,
+            "started_at": self.started_at,
+            "finished_at": time.time(),
+            "platform": sys.platform,
+            "python": sys.version.split()[0],
+            "frozen": bool(getattr(sys, "frozen", False)),
+            "stages": stages,
+            "totals": self.totals(),
+            "download": get_download_scheduler().stats(),
+        }
+        report_path = Path(report_path)
+        temp_path = report_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2, default=str)
+        os.replace(temp_path, report_path)
+        logger.info(f"실행 보고서를 저장하였습니다: {report_path}")
+
+
+_run_report = RunReport()
+
+
+# 이번 실행의 보고서 가져오기
+def get_run_report():
+    return _run_report
+
+
+# 실행 보고서 저장 (실패해도 설치에는 영향 없음)
+def write_run_report(report_dir=None):
+    try:
+        get_run_report().write(Path(report_dir or get_log_dir()) / RUN_REPORT_NAME)
+    except Exception as e:
+        logger.warning(f"실행 보고서를 저장하는 중 오류 발생: {e}")
+
+
+# ZIP 파일 구조 확인
+# 목록을 읽고 항목마다 로컬 헤더를 열어 보아, 서로 다른 파일을 이어 붙인 경우 등을 찾아냅니다.
+def check_zip_archive(zip_path):
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        for info in zip_ref.infolist():
+            with zip_ref.open(info):
+                pass
+
+
+# 파일의 SHA-256 해시 계산
+def compute_file_sha256(file_path, chunk_size=1024 * 1024):
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+# 패치 ZIP 파일 캐시
+# 내용 해시(SHA-256)로 파일을 저장하고 구글 드라이브 ID를 해시에 연결합니다.
+# 같은 ID는 한 번만 받으며, 용량을 넘으면 가장 오래 사용하지 않은 파일부터 삭제합니다.
+class ArchiveCache:
+    # fallback: 먼저 확인할 다른 캐시 (다른 드라이브로 옮긴 캐시에서 기본 캐시의 파일을 그대로 사용)
+    # temporary: 설치가 끝나면 폴더째 삭제할 임시 캐시
+    def __init__(
+        self,
+        cache_dir,
+        max_bytes=ARCHIVE_CACHE_MAX_BYTES,
+        fallback=None,
+        temporary=False,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.fallback = fallback
+        self.temporary = temporary
+        self.blob_dir = self.cache_dir / "archives"
+        self.partial_dir = self.cache_dir / "partial"
+        self.index_path = self.cache_dir / "index.json"
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._fetch_locks = {}
+        # 이번 실행에서 사용한 파일은 삭제 대상에서 제외
+        self._used_hashes = set()
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.partial_dir.mkdir(parents=True, exist_ok=True)
+        self._index = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                index = json.load(file)
+            index.setdefault("archives", {})
+            index.setdefault("drive_ids", {})
+            return index
+        except FileNotFoundError:
+            return {"archives": {}, "drive_ids": {}}
+        except Exception as e:
+            logger.warning(f"캐시 목록을 읽는 중 오류 발생: {e}")
+            return {"archives": {}, "drive_ids": {}}
+
+    def _save_index(self):
+        temp_path = self.index_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(self._index, file, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.index_path)
+
+    def _blob_path(self, sha256):
+        return self.blob_dir / f"{sha256}.zip"
+
+    # 캐시에 있는 경우 파일 경로 반환 (없으면 None)
+    # expected_sha256이 주어지면 내용이 다른(이전 버전) 파일은 없는 것으로 처리합니다.
+    def get(self, file_id, expected_sha256=None):
+        if self.fallback is not None:
+            fallback_path = self.fallback.get(file_id, expected_sha256)
+            if fallback_path is not None:
+                return fallback_path
+        with self._lock:
+            sha256 = self._index["drive_ids"].get(file_id)
+            entry = self._index["archives"].get(sha256) if sha256 else None
+            if entry is None:
+                return None
+            if expected_sha256 and sha256 != expected_sha256:
+                return None
+            blob_path = self._blob_path(sha256)
+            try:
+                if blob_path.stat().st_size != entry["size"]:
+                    raise FileNotFoundError(blob_path)
+            except FileNotFoundError:
+                # 크기가 다르거나 지워진 파일은 캐시에서 제거
+                del self._index["archives"][sha256]
+                self._index["drive_ids"].pop(file_id, None)
+                self._save_index()
+                return None
+            entry["last_used"] = time.time()
+            self._used_hashes.add(sha256)
+            self._save_index()
+            return blob_path
+
+    # 캐시에 있는 구글 드라이브 ID와 파일 해시 목록
+    def drive_ids(self):
+        with self._lock:
+            return dict(self._index["drive_ids"])
+
+    # 임시 캐시 정리 (받은 파일과 폴더를 모두 삭제)
+    def remove(self):
+        with self._lock:
+            self._index = {"archives": {}, "drive_ids": {}}
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    # 손상된 파일을 캐시에서 제거 (다음 실행에서 다시 받음)
+    def discard(self, file_id):
+        if self.fallback is not None:
+            self.fallback.discard(file_id)
+        with self._lock:
+            sha256 = self._index["drive_ids"].pop(file_id, None)
+            if sha256 is None:
+                return
+            if sha256 not in self._index["drive_ids"].values():
+                self._index["archives"].pop(sha256, None)
+                try:
+                    self._blob_path(sha256).unlink(missing_ok=True)
+                except OSError as e:
+                    logger.warning(f"캐시 파일을 삭제하는 중 오류 발생: {e}")
+            self._save_index()
+
+    # 캐시에 없으면 downloader로 받아서 저장한 뒤 경로 반환
+    def fetch(
+        self,
+        file_id,
+        downloader,
+        progress_callback=None,
+        progress_hook=None,
+        expected_sha256=None,
+    ):
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(file_id, threading.Lock())
+
+        # 같은 ID를 동시에 요청하면 먼저 시작한 다운로드가 끝날 때까지 대기
+        with fetch_lock:
+            cached_path = self.get(file_id, expected_sha256)
+            if cached_path is not None:
+                if progress_callback:
+                    progress_callback(
+                        "이미 받아 둔 패치 파일이 있어 다운로드를 건너뜁니다."
+                    )
+                return cached_path
+
+            partial_path = self.partial_dir / f"{file_id}.zip"
+            downloader(file_id, partial_path, progress_callback, progress_hook)
+            sha256 = compute_file_sha256(partial_path)
+            size = partial_path.stat().st_size
+            if expected_sha256 and sha256 != expected_sha256:
+                partial_path.unlink()
+                raise DownloadError(
+                    "받은 패치 파일의 해시가 챕터 목록과 일치하지 않습니다."
+                )
+            # 손상된 파일이 캐시에 남아 매번 재사용되지 않도록 저장 전에 확인
+            try:
+                check_zip_archive(partial_path)
+            except (zipfile.BadZipFile, zlib.error, EOFError) as e:
+                partial_path.unlink()
+                raise DownloadError(f"받은 패치 파일이 손상되었습니다: {e}")
+
+            with self._lock:
+                blob_path = self._blob_path(sha256)
+                # 같은 내용의 파일이 이미 있으면 새로 받은 파일은 버림
+                if blob_path.exists():
+                    partial_path.unlink()
+                else:
+                    os.replace(partial_path, blob_path)
+                self._index["archives"][sha256] = {
+                    "size": size,
+                    "last_used": time.time(),
+                }
+                self._index["drive_ids"][file_id] = sha256
+                self._used_hashes.add(sha256)
+                self._evict()
+                self._save_index()
+            return blob_path
+
+    # 용량 제한을 넘으면 가장 오래 사용하지 않은 파일부터 삭제
+    def _evict(self):
+        archives = self._index["archives"]
+        total_size = sum(entry["size"] for entry in archives.values())
+        candidates = sorted(
+            (
+                (entry["last_used"], sha256)
+                for sha256, entry in archives.items()
+                if sha256 not in self._used_hashes
+            ),
+        )
+        for _, sha256 in candidates:
+            if total_size <= self.max_bytes:
+                break
+            try:
+                self._blob_path(sha256).unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"캐시 파일을 삭제하는 중 오류 발생: {e}")
+                continue
+            total_size -= archives.pop(sha256)["size"]
+            self._index["drive_ids"] = {
+                file_id: blob_hash
+                for file_id, blob_hash in self._index["drive_ids"].items()
+                if blob_hash != sha256
+            }
+
+
+_archive_cache = None
+_archive_cache_lock = threading.Lock()
+
+
+# 기본 패치 파일 캐시 가져오기
+def get_archive_cache():
+    global _archive_cache
+    with _archive_cache_lock:
+        if _archive_cache is None:
+            _archive_cache = ArchiveCache(get_app_data_dir() / "cache")
+        return _archive_cache
+
+
+# 패치 ZIP 파일 다운로드
+def download_patch_archive(
+    file_id,
+    progress_callback=None,
+    cache=None,
+    downloader=None,
+    progress_hook=None,
+    expected_sha256=None,
+):
+    cache = cache or get_archive_cache()
+    downloader = downloader or download_from_google_drive
+    if progress_callback:
+        progress_callback(
+            "구글 드라이브에서 패치 파일을 가져오는 중입니다. 잠시만 기다려 주시기 바랍니다."
+        )
+    zip_path = cache.fetch(
+        file_id, downloader, progress_callback, progress_hook, expected_sha256
+    )
+    if progress_callback:
+        progress_callback(
+            f"다운로드가 완료되었습니다. 저장된 위치는 다음과 같습니다: {zip_path}"
+        )
+    return zip_path
+
+
+# ZIP 목록에서 패치 루트 폴더 찾기 (압축 해제 전)
+# 패치 루트의 접두 경로(예: "한국어 패치/")를 반환하며, 찾지 못하면 None을 반환합니다.
+def find_patch_root(member_names, special_handling=False):
+    if special_handling:
+        # 가장 얕은 위치의 'Data' 폴더 찾기
+        candidates = []
+        for name in member_names:
+            parts = name.split("/")[:-1]
+            if "Data" in parts:
+                depth = parts.index("Data")
+                candidates.append((depth, "/".join(parts[: depth + 1]) + "/"))
+        return min(candidates)[1] if candidates else None
+
+    # 일반 처리: 최상위에서 '패치'가 이름에 포함된 폴더 찾기
+    for name in member_names:
+        parts = name.split("/")
+        if len(parts) > 1 and "패치" in parts[0]:
+            return parts[0] + "/"
+    return None
+
+
+# 압축 파일 항목이 기록될 경로 (대상 폴더 밖을 가리키면 None)
+# Windows에서는 'C:evil.dll'이나 '/Windows/evil'도 절대 경로가 아니므로
+# 드라이브/루트가 있는 이름을 거부한 뒤, 실제 경로로 풀어 대상 폴더 안인지 한 번 더 확인합니다.
+def resolve_member_path(root, name, resolved_root=None):
+    windows_path = PureWindowsPath(name)
+    if windows_path.drive or windows_path.root or ".." in windows_path.parts:
+        return None
+    target_path = Path(root) / Path(*windows_path.parts)
+    resolved_root = resolved_root or Path(root).resolve()
+    if not target_path.resolve().is_relative_to(resolved_root):
+        return None
+    return target_path
+
+
+# ZIP 항목 이름 복원
+# UTF-8 플래그(0x800)가 없는 이름은 zipfile이 CP437로 읽으므로, 원래 바이트로 되돌려
+# UTF-8(플래그 없이 UTF-8로 저장하는 압축 프로그램)과 CP949(한국어 Windows 기본) 순서로 다시 읽습니다.
+def decode_member_name(info):
+    if info.flag_bits & 0x800:
+        return info.filename
+    try:
+        raw_name = info.filename.encode("cp437")
+    except UnicodeEncodeError:
+        return info.filename
+    for encoding in ("utf-8", "cp949"):
+        try:
+            return raw_name.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return info.filename
+
+
+# 패치 루트 아래의 파일 목록 (ZipInfo, 패치 루트 기준 상대 경로)
+# 패치 루트를 찾지 못하면 None을 반환합니다.
+def list_patch_members(zip_ref, special_handling=False):
+    members = [(info, decode_member_name(info)) for info in zip_ref.infolist()]
+    patch_root = find_patch_root([name for _, name in members], special_handling)
+    if patch_root is None:
+        return None
+    return [
+        (info, name[len(patch_root) :])
+        for info, name in members
+        if name.startswith(patch_root) and not info.is_dir()
+    ]
+
+
+# 게임 폴더에 기록된 패치 설치 목록(manifest) 읽기
+def load_patch_manifest(game_path):
+    manifest_path = Path(game_path) / PATCH_MANIFEST_NAME
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+        if manifest.get("version") != PATCH_MANIFEST_VERSION:
+            return None
+        return manifest
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"패치 설치 목록을 읽는 중 오류 발생: {e}")
+        return None
+
+
+# 패치 설치 목록(manifest)을 게임 폴더에 저장
+def save_patch_manifest(game_path, archive_hash, files, patch_version=None):
+    manifest_path = Path(game_path) / PATCH_MANIFEST_NAME
+    manifest = {
+        "version": PATCH_MANIFEST_VERSION,
+        "archive_sha256": archive_hash,
+        "patch_version": patch_version,
+        "files": files,
+    }
+    temp_path = manifest_path.with_suffix(".tmp")
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+    os.replace(temp_path, manifest_path)
+
+
+# 설치 목록과 실제 파일, ZIP 정보를 비교하여 이미 적용된 파일인지 확인
+def is_member_up_to_date(info, target_path, manifest_entry):
+    if manifest_entry is None:
+        return False
+    if (
+        manifest_entry.get("crc32") != info.CRC
+        or manifest_entry.get("size") != info.file_size
+    ):
+        return False
+    try:
+        stat = target_path.stat()
+    except OSError:
+        return False
+    # 설치 이후 Steam 파일 검사 등으로 바뀐 파일은 다시 적용
+    return stat.st_size == info.file_size and stat.st_mtime_ns == manifest_entry.get(
+        "mtime_ns"
+    )
+
+
+# 파일의 CRC32 계산 (큰 파일은 메모리 매핑으로 나누어 읽음)
+def compute_file_crc32(file_path, chunk_size=HASH_CHUNK_SIZE):
+    crc = 0
+    with open(file_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size >= MMAP_HASH_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    for offset in range(0, size, chunk_size):
+                        crc = zlib.crc32(view[offset : offset + chunk_size], crc)
+        else:
+            for chunk in iter(lambda: file.read(chunk_size), b""):
+                crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+# 게임 폴더의 한글 패치 적용 상태 확인
+# 패치 ZIP 파일이 있으면 그 목록과, 없으면 설치 목록(manifest)과 비교합니다.
+# 크기와 수정 시각이 설치 당시와 같은 파일은 ZIP에 저장된 CRC32를 그대로 믿고,
+# 나머지 파일(deep이면 모든 파일)만 여러 스레드에서 CRC32를 계산합니다.
+# status는 installed, partial, outdated, interrupted, not_installed 중 하나입니다.
+def verify_patch_installation(
+    game_path,
+    zip_path=None,
+    special_handling=False,
+    deep=False,
+    archive_hash=None,
+    max_workers=VERIFY_WORKERS,
+    patch_version=None,
+):
+    game_path = Path(game_path)
+    result = {"status": "not_installed", "checked": 0, "missing": [], "mismatched": []}
+    try:
+        interrupted = PatchTransaction(game_path).interrupted
+    except OSError as e:
+        # 손상된 저널을 복구하지 못하면 적용이 끝났는지 알 수 없으므로 중단된 것으로 처리
+        logger.warning(f"패치 기록을 복구하지 못했습니다: {game_path}, {e}")
+        interrupted = True
+    if interrupted:
+        result["status"] = "interrupted"
+        return result
+    manifest = load_patch_manifest(game_path)
+    if manifest is None:
+        return result
+    manifest_files = manifest["files"]
+
+    expected = None
+    if zip_path is not None:
+        try:
+            with zipfile.ZipFile(zip_path, "r") as zip_ref:
+                patch_members = list_patch_members(zip_ref, special_handling)
+            if patch_members is not None:
+                expected = {
+                    relative_name: (info.file_size, info.CRC)
+                    for info, relative_name in patch_members
+                }
+        except zipfile.BadZipFile:
+            logger.warning(f"패치 파일이 손상되어 설치 목록으로 확인합니다: {zip_path}")
+    if expected is None:
+        zip_path = None
+        expected = {
+            relative_name: (entry["size"], entry["crc32"])
+            for relative_name, entry in manifest_files.items()
+        }
+
+    needs_hash = []
+    for relative_name, (size, crc) in expected.items():
+        target_path = game_path / relative_name
+        try:
+            stat = target_path.stat()
+        except OSError:
+            result["missing"].append(relative_name)
+            continue
+        if stat.st_size != size:
+            result["mismatched"].append(relative_name)
+            continue
+        entry = manifest_files.get(relative_name)
+        if (
+            not deep
+            and entry is not None
+            and entry["crc32"] == crc
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            continue
+        needs_hash.append((relative_name, target_path, crc))
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="verify"
+    ) as executor:
+        actual_crcs = executor.map(lambda item: compute_file_crc32(item[1]), needs_hash)
+        for (relative_name, _, crc), actual_crc in zip(needs_hash, actual_crcs):
+            if actual_crc != crc:
+                result["mismatched"].append(relative_name)
+    result["checked"] = len(expected)
+
+    if not result["missing"] and not result["mismatched"]:
+        # 챕터 목록의 패치 버전과 다르면 새 패치가 나온 것 (버전 기록이 없으면 확인하지 않음)
+        installed_version = manifest.get("patch_version")
+        if patch_version and installed_version and installed_version != patch_version:
+            result["status"] = "outdated"
+        else:
+            result["status"] = "installed"
+    elif zip_path is not None and manifest.get("archive_sha256") != (
+        archive_hash or compute_file_sha256(zip_path)
+    ):
+        # 이전 패치 파일로 적용되어 최신 패치와 다름
+        result["status"] = "outdated"
+    else:
+        result["status"] = "partial"
+    return result
+
+
+# 패치 적용 트랜잭션
+# 파일은 임시 이름으로 기록한 뒤 os.replace로 교체하고, 덮어쓴 원본은 보관 폴더로 옮겨 둡니다.
+# 저널에 이번 실행에서 새로 만들 파일을 먼저 기록하므로, 중단되어도 되돌리거나 이어서 적용할 수 있습니다.
+# 완료(commit)하면 패치 전 원본만 백업 압축 파일에 모아 두어 패치 제거 시 복원합니다.
+class PatchTransaction:
+    def __init__(self, game_path):
+        self.game_path = Path(game_path)
+        self.journal_path = self.game_path / PATCH_JOURNAL_NAME
+        self.backup_path = self.game_path / PATCH_BACKUP_NAME
+        self.staging_dir = self.game_path / PATCH_STAGING_DIR_NAME
+        self._journal_corrupted = False
+        self.journal = self._load_journal()
+        self._run_created = set(self.journal["run_created"])
+        if self._journal_corrupted:
+            # 보관 폴더의 원본을 되돌리고 저널을 새로 기록하여 적용/제거를 다시 할 수 있게 함
+            self.rollback()
+
+    def _load_journal(self):
+        journal = {"version": 1, "state": "committed", "created": [], "run_created": []}
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as file:
+                journal.update(json.load(file))
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            # 손상된 저널은 중단된 적용으로 보고, 패치가 새로 만든 파일은
+            # 설치 목록 중 백업에 없는 파일로 다시 계산
+            logger.warning(f"패치 기록이 손상되어 복구합니다: {self.journal_path}, {e}")
+            self._journal_corrupted = True
+            manifest_files = (load_patch_manifest(self.game_path) or {}).get(
+                "files", {}
+            )
+            try:
+                backup_names = self._backup_names()
+            except (OSError, zipfile.BadZipFile):
+                backup_names = set()
+            journal["state"] = "applying"
+            journal["created"] = sorted(set(manifest_files) - backup_names)
+        return journal
+
+    def _save_journal(self):
+        temp_path = self.journal_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(self.journal, file, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.journal_path)
+
+    def _backup_names(self):
+        if not self.backup_path.exists():
+            return set()
+        with zipfile.ZipFile(self.backup_path, "r") as backup:
+            return set(backup.namelist())
+
+    def _staged_files(self):
+        if not self.staging_dir.exists():
+            return []
+        return [
+            (path, path.relative_to(self.staging_dir).as_posix())
+            for path in self.staging_dir.rglob("*")
+            if path.is_file()
+        ]
+
+    # 이전 실행이 중간에 중단되었는지 여부
+    @property
+    def interrupted(self):
+        return self.journal["state"] == "applying"
+
+    # 이번 실행에서 새로 만들 파일을 저널에 먼저 기록
+    def begin(self, planned_created):
+        self._run_created.update(planned_created)
+        self.journal["state"] = "applying"
+        self.journal["run_created"] = sorted(self._run_created)
+        self._save_journal()
+
+    # 패치 파일 하나를 임시 이름으로 기록한 뒤 교체
+    # 여러 스레드에서 서로 다른 파일을 동시에 기록할 수 있습니다.
+    # 폴더를 미리 만들어 두었으면 make_dirs=False로 폴더 확인을 건너뜁니다.
+    def write_member(self, zip_ref, info, relative_name, make_dirs=True):
+        target_path = self.game_path / relative_name
+        temp_path = target_path.with_name(target_path.name + PATCH_TEMP_SUFFIX)
+        if make_dirs:
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+        with zip_ref.open(info) as source, open(temp_path, "wb") as target:
+            shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
+
+        # 이번 실행에서 처음 덮어쓰는 파일만 보관 폴더로 옮김
+        staged_path = self.staging_dir / relative_name
+        if (
+            relative_name not in self._run_created
+            and target_path.exists()
+            and not staged_path.exists()
+        ):
+            staged_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(target_path, staged_path)
+        os.replace(temp_path, target_path)
+        return target_path
+
+    # 적용 완료: 패치 전 원본만 백업 압축 파일에 추가하고 보관 폴더 정리
+    def commit(self):
+        backup_names = self._backup_names()
+        created = set(self.journal["created"])
+        originals = [
+            (path, relative_name)
+            for path, relative_name in self._staged_files()
+            if relative_name not in backup_names and relative_name not in created
+        ]
+        if originals:
+            # 기존 백업을 복사한 뒤 추가하여 중간에 실패해도 기존 백업은 보존
+            temp_path = self.backup_path.with_suffix(".tmp")
+            if self.backup_path.exists():
+                shutil.copyfile(self.backup_path, temp_path)
+            with zipfile.ZipFile(temp_path, "a", zipfile.ZIP_DEFLATED) as backup:
+                for path, relative_name in originals:
+                    backup.write(path, relative_name)
+            os.replace(temp_path, self.backup_path)
+
+        created.update(self._run_created - backup_names)
+        self.journal["state"] = "committed"
+        self.journal["created"] = sorted(created)
+        self.journal["run_created"] = []
+        self._run_created = set()
+        self._save_journal()
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+    # 이번 실행(또는 중단된 실행)의 변경 내용을 되돌림
+    def rollback(self):
+        for relative_name in self._run_created:
+            target_path = self.game_path / relative_name
+            target_path.unlink(missing_ok=True)
+            target_path.with_name(target_path.name + PATCH_TEMP_SUFFIX).unlink(
+                missing_ok=True
+            )
+        for path, relative_name in self._staged_files():
+            target_path = self.game_path / relative_name
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, target_path)
+            target_path.with_name(target_path.name + PATCH_TEMP_SUFFIX).unlink(
+                missing_ok=True
+            )
+        self.journal["state"] = "committed"
+        self.journal["run_created"] = []
+        self._run_created = set()
+        self._save_journal()
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+    # 한글 패치 제거: 덮어쓴 원본을 복원하고 패치가 새로 만든 파일을 삭제
+    def uninstall(self):
+        if self.interrupted:
+            self.rollback()
+
+        removed_count = 0
+        for relative_name in self.journal["created"]:
+            target_path = self.game_path / relative_name
+            if target_path.exists():
+                target_path.unlink()
+                removed_count += 1
+
+        restored_count = 0
+        if self.backup_path.exists():
+            with zipfile.ZipFile(self.backup_path, "r") as backup:
+                for info in backup.infolist():
+                    if info.is_dir():
+                        continue
+                    target_path = self.game_path / info.filename
+                    temp_path = target_path.with_name(
+                        target_path.name + PATCH_TEMP_SUFFIX
+                    )
+                    target_path.parent.mkdir(parents=True, exist_ok=True)
+                    with backup.open(info) as source, open(temp_path, "wb") as target:
+                        shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
+                    os.replace(temp_path, target_path)
+                    restored_count += 1
+
+        for path in (
+            self.backup_path,
+            self.journal_path,
+            self.game_path / PATCH_MANIFEST_NAME,
+        ):
+            path.unlink(missing_ok=True)
+        return restored_count, removed_count
+
+
+# 한글 패치 제거
+def uninstall_patch(game_path, progress_callback=None):
+    transaction = PatchTransaction(game_path)
+    if not transaction.journal_path.exists():
+        if progress_callback:
+            progress_callback("한글 패치 적용 기록이 없어 제거할 수 없습니다.")
+        return False
+    restored_count, removed_count = transaction.uninstall()
+    if progress_callback:
+        progress_callback(
+            f"한글 패치를 제거하였습니다. (원본 복원 {restored_count}개, 삭제 {removed_count}개)"
+        )
+    return True
+
+
+# 다운로드된 패치 ZIP 파일을 게임 폴더에 바로 압축 해제하여 적용
+# 임시 폴더에 풀었다가 다시 복사하지 않고, 패치 루트 아래 파일만 최종 위치에 기록합니다.
+# 이전 설치 목록과 비교하여 없거나 바뀐 파일만 기록하며, 실패하면 변경 내용을 모두 되돌립니다.
+# progress_hook(적용한 파일 수, 전체 파일 수, 기록한 바이트, 전체 바이트)로 진행 상황을 알립니다.
+def apply_patch_archive(
+    zip_path,
+    destination,
+    progress_callback=None,
+    special_handling=False,
+    archive_hash=None,
+    progress_hook=None,
+    patch_version=None,
+    stats=None,
+    max_workers=EXTRACT_WORKERS,
+):
+    destination = Path(destination)
+    # stats가 주어지면 단계별 소요 시간(locate/plan/write/commit)과 파일 수, 바이트 수를 기록
+    stats = {} if stats is None else stats
+    phase_started_at = time.perf_counter()
+    if archive_hash is None:
+        archive_hash = compute_file_sha256(zip_path)
+    manifest = load_patch_manifest(destination) or {}
+    previous_files = manifest.get("files", {})
+    try:
+        zip_ref = zipfile.ZipFile(zip_path, "r")
+    except zipfile.BadZipFile:
+        if progress_callback:
+            progress_callback("압축 파일이 손상된 것 같습니다.")
+        raise
+
+    with zip_ref:
+        # 2. 압축 파일 목록에서 패치 루트 아래의 파일 찾기
+        patch_members = list_patch_members(zip_ref, special_handling)
+        stats["locate_seconds"] = time.perf_counter() - phase_started_at
+        phase_started_at = time.perf_counter()
+        if patch_members is None:
+            if progress_callback and special_handling:
+                progress_callback(
+                    "패치 파일 내에서 'Data' 폴더를 찾을 수 없어 적용이 불가능합니다."
+                )
+            elif progress_callback:
+                progress_callback(
+                    "'한국어 패치' 폴더를 확인할 수 없어 패치를 적용할 수 없습니다."
+                )
+            return False
+
+        # 3. 이미 같은 내용으로 적용된 파일을 제외하고 기록할 파일 목록 작성
+        installed_files = {}
+        pending_items = []
+        resolved_destination = destination.resolve()
+        for info, relative_name in patch_members:
+            target_path = resolve_member_path(
+                destination, relative_name, resolved_destination
+            )
+            # 게임 폴더 밖을 가리키는 경로는 건너뜀
+            if target_path is None:
+                if progress_callback:
+                    progress_callback(
+                        f"잘못된 경로가 포함되어 건너뛰었습니다: {info.filename}"
+                    )
+                continue
+            previous_entry = previous_files.get(relative_name)
+            if is_member_up_to_date(info, target_path, previous_entry):
+                installed_files[relative_name] = previous_entry
+            else:
+                pending_items.append((info, relative_name, target_path))
+        skipped_count = len(installed_files)
+        stats["plan_seconds"] = time.perf_counter() - phase_started_at
+        stats["files_skipped"] = skipped_count
+        phase_started_at = time.perf_counter()
+
+        # 4. 새로 만들 파일을 저널에 기록한 뒤 적용 시작
+        transaction = PatchTransaction(destination)
+        if transaction.interrupted:
+            if progress_callback:
+                progress_callback("이전에 중단된 패치 적용을 이어서 진행합니다.")
+        transaction.begin(
+            [
+                relative_name
+                for _, relative_name, target_path in pending_items
+                if not target_path.exists()
+            ]
+        )
+
+        # 5. 총 파일 수를 기반으로 진행률 표시하며 여러 작업자가 바로 압축 해제
+        if progress_callback:
+            progress_callback("패치 파일을 적용하고 있습니다. 잠시만 기다려 주십시오.")
+        total_bytes = sum(info.file_size for info, _, _ in pending_items)
+        written_count = 0
+        written_bytes = 0
+        failure = None
+        progress_lock = threading.Lock()
+        failed = threading.Event()
+        zip_handles = ZipHandlePool(zip_path)
+
+        # 폴더 구조는 작업 시작 전에 한 번만 생성
+        try:
+            make_directories(target_path.parent for _, _, target_path in pending_items)
+        except OSError as e:
+            if progress_callback:
+                progress_callback(
+                    f"폴더를 만드는 중 문제가 발생하였습니다: {e}\n"
+                    "변경된 파일을 원래대로 되돌립니다."
+                )
+            transaction.rollback()
+            return False
+
+        def write_batch(batch):
+            nonlocal written_count, written_bytes, failure
+            zip_handle = zip_handles.get()
+            for info, relative_name, target_path in batch:
+                # 다른 작업자가 실패하면 남은 파일은 기록하지 않음
+                if failed.is_set():
+                    return
+                try:
+                    transaction.write_member(
+                        zip_handle, info, relative_name, make_dirs=False
+                    )
+                    entry = {
+                        "size": info.file_size,
+                        "crc32": info.CRC,
+                        "mtime_ns": target_path.stat().st_mtime_ns,
+                    }
+                except Exception as e:
+                    with progress_lock:
+                        failure = failure or (info, target_path, e)
+                    failed.set()
+                    return
+                with progress_lock:
+                    installed_files[relative_name] = entry
+                    written_count += 1
+                    written_bytes += info.file_size
+                    if progress_hook:
+                        progress_hook(
+                            written_count,
+                            len(pending_items),
+                            written_bytes,
+                            total_bytes,
+                        )
+
+        with zip_handles, ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="apply"
+        ) as executor:
+            for _ in executor.map(write_batch, plan_extract_batches(pending_items)):
+                pass
+
+        if failure:
+            # 모든 작업자가 멈춘 뒤, 일부만 적용된 상태로 남지 않도록 이번 실행의 변경 내용을 되돌림
+            info, target_path, e = failure
+            if progress_callback:
+                progress_callback(
+                    f"파일 복사 중 문제가 발생하였습니다: {info.filename} -> {target_path}\n"
+                    f"오류: {e}\n변경된 파일을 원래대로 되돌립니다."
+                )
+            transaction.rollback()
+            # 압축 파일 자체가 손상된 경우 호출한 쪽에서 캐시를 정리할 수 있도록 전달
+            if isinstance(e, (zipfile.BadZipFile, zlib.error)):
+                raise zipfile.BadZipFile(str(e)) from e
+            return False
+        stats["write_seconds"] = time.perf_counter() - phase_started_at
+        stats["files"] = len(pending_items)
+        stats["bytes"] = written_bytes
+        phase_started_at = time.perf_counter()
+        transaction.commit()
+        stats["commit_seconds"] = time.perf_counter() - phase_started_at
+
+    # 6. 다음 실행에서 바뀐 파일만 적용할 수 있도록 설치 목록 저장
+    try:
+        save_patch_manifest(destination, archive_hash, installed_files, patch_version)
+    except Exception as e:
+        logger.warning(f"패치 설치 목록을 저장하는 중 오류 발생: {e}")
+    if progress_callback:
+        progress_callback(
+            f"패치가 완료되었습니다. 적용된 경로는 다음과 같습니다: {destination} "
+            f"(적용 {written_count}개, 변경 없음 {skipped_count}개)"
+        )
+    return True  # 패치 성공
+
+
+# 챕터 목록의 패치 버전이 이미 온전히 적용되어 있는지 확인 (네트워크 사용 없음)
+def is_patch_version_installed(chapter, game_path):
+    patch_version = chapter.get("patch_version")
+    if not patch_version:
+        return False
+    manifest = load_patch_manifest(game_path)
+    if manifest is None or manifest.get("patch_version") != patch_version:
+        return False
+    return verify_patch_installation(game_path)["status"] == "installed"
+
+
+# 이전 실행에서 측정한 다운로드/적용 속도 (바이트/초)
+def load_throughput_history():
+    history = {"download": DEFAULT_DOWNLOAD_SPEED, "apply": DEFAULT_APPLY_SPEED}
+    try:
+        with open(
+            get_app_data_dir() / THROUGHPUT_HISTORY_NAME, "r", encoding="utf-8"
+        ) as file:
+            history.update(json.load(file))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"속도 기록을 읽는 중 오류 발생: {e}")
+    return history
+
+
+_throughput_lock = threading.Lock()
+
+
+# 측정한 속도를 기록 (급격한 변화는 완화하여 반영)
+def record_throughput(kind, byte_count, seconds):
+    # 너무 작은 작업은 속도가 정확하지 않으므로 제외
+    if byte_count < 1024 * 1024 or seconds <= 0:
+        return
+    with _throughput_lock:
+        history = load_throughput_history()
+        history[kind] = history[kind] * 0.5 + byte_count / seconds * 0.5
+        try:
+            history_path = get_app_data_dir() / THROUGHPUT_HISTORY_NAME
+            history_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(history_path, "w", encoding="utf-8") as file:
+                json.dump(history, file)
+        except OSError as e:
+            logger.warning(f"속도 기록을 저장하는 중 오류 발생: {e}")
+
+
+# 챕터 하나의 패치 파일 크기와 게임 폴더에 기록할 용량 확인
+# 받아 둔 파일이 없으면 미러에서, 미러에도 없으면 구글 드라이브에서 파일 끝의 중앙 디렉터리만 읽습니다.
+# 확인하지 못한 값은 None으로 남깁니다.
+def inspect_patch_archive(chapter, game_path, cache, session, mirror_sources=None):
+    file_id = chapter["google_drive_id"]
+    zip_path = cache.get(file_id, chapter.get("archive_sha256"))
+    result = {
+        "chapter": chapter["key"],
+        "cached": zip_path is not None,
+        "mirror": None,
+        "archive_size": chapter.get("archive_size"),
+        "write_bytes": None,
+        "backup_bytes": None,
+    }
+    try:
+        # 받아 둔 파일, 미러, 구글 드라이브 순서로 확인 (다운로드와 같은 순서)
+        mirror = (
+            open_mirror_archive(mirror_sources, file_id, session)
+            if zip_path is None
+            else None
+        )
+        if zip_path is not None:
+            result["archive_size"] = zip_path.stat().st_size
+            source = open(zip_path, "rb")
+        elif mirror is not None:
+            result["mirror"], size, source = mirror
+            result["archive_size"] = size or result["archive_size"]
+            if source is None:
+                return result
+        else:
+            url = resolve_google_drive_download(session, file_id)
+            size, accepts_ranges = probe_download(session, url)
+            result["archive_size"] = size or result["archive_size"]
+            if not size or not accepts_ranges:
+                return result
+            source = HttpRangeReader(session, url, size)
+        with source, zipfile.ZipFile(source) as zip_ref:
+            patch_members = list_patch_members(
+                zip_ref, chapter.get("special_handling", False)
+            )
+    except Exception as e:
+        logger.warning(
+            f"{chapter['display_name']} 패치 파일 정보를 확인하는 중 오류 발생: {e}"
+        )
+        return result
+    if patch_members is None:
+        return result
+
+    # 바뀐 파일만 기록하며, 덮어쓰는 원본은 백업 압축 파일에 보관됨
+    previous_files = (load_patch_manifest(game_path) or {}).get("files", {})
+    write_bytes = 0
+    backup_bytes = 0
+    for info, relative_name in patch_members:
+        target_path = Path(game_path) / relative_name
+        previous_entry = previous_files.get(relative_name)
+        if is_member_up_to_date(info, target_path, previous_entry):
+            continue
+        write_bytes += info.file_size
+        if previous_entry is None:
+            try:
+                backup_bytes += target_path.stat().st_size
+            except OSError:
+                pass
+    result["write_bytes"] = write_bytes
+    result["backup_bytes"] = backup_bytes
+    return result
+
+
+# 드라이브(볼륨) 구분용 키
+def get_volume_key(path):
+    path = Path(path)
+    # 아직 없는 폴더는 존재하는 상위 폴더 기준으로 확인
+    while not path.exists() and path.parent != path:
+        path = path.parent
+    return os.stat(path).st_dev, path
+
+
+# 예상 소요 시간 표시
+def format_duration(seconds):
+    seconds = int(seconds + 0.5)
+    if seconds < 60:
+        return f"{seconds}초"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}분 {seconds}초"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}시간 {minutes}분"
+
+
+# 설치 전 점검
+# 챕터별 다운로드/기록 용량을 확인하고 드라이브별 남은 공간과 비교합니다.
+# 캐시 드라이브가 부족하면 게임이 있는 드라이브에 임시 캐시 폴더(설치 후 삭제)를 잡아 같은 드라이브 안에서 이름만 바꾸도록 합니다.
+# pin_cache가 참이면(--cache-dir 지정) 캐시를 옮기지 않고 그 드라이브의 공간만 확인합니다.
+def plan_installation(
+    jobs,
+    cache=None,
+    session=None,
+    max_workers=DOWNLOAD_WORKERS,
+    pin_cache=False,
+    mirror_sources=None,
+):
+    cache = cache or get_archive_cache()
+    session = session or get_http_session()
+    # 파이프라인이 건너뛸 챕터(같은 버전이 이미 적용됨)는 네트워크 확인과 용량 계산에서 제외
+    up_to_date = []
+    pending_jobs = []
+    for chapter, game_path in jobs:
+        if is_patch_version_installed(chapter, game_path):
+            up_to_date.append(chapter["key"])
+        else:
+            pending_jobs.append((chapter, game_path))
+    jobs = pending_jobs
+    with get_run_report().stage("preflight", chapters=len(jobs)), ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="preflight"
+    ) as executor:
+        chapters = list(
+            executor.map(
+                lambda job: inspect_patch_archive(
+                    job[0], job[1], cache, session, mirror_sources
+                ),
+                jobs,
+            )
+        )
+
+    download_bytes = sum(
+        info["archive_size"] or 0 for info in chapters if not info["cached"]
+    )
+    write_bytes = sum(info["write_bytes"] or 0 for info in chapters)
+    # 크기를 확인하지 못한 챕터는 0바이트로 보지 않고 따로 알림
+    unknown_size = [
+        info["chapter"]
+        for info in chapters
+        if info["archive_size"] is None or info["write_bytes"] is None
+    ]
+
+    # 드라이브별 필요한 공간 합산
+    volumes = {}
+
+    def require(path, byte_count):
+        key, existing_path = get_volume_key(path)
+        if key not in volumes:
+            volumes[key] = {
+                "path": str(existing_path),
+                "free": shutil.disk_usage(existing_path).free,
+                "required": DISK_SPACE_MARGIN,
+            }
+        volumes[key]["required"] += byte_count
+        return key
+
+    for (chapter, game_path), info in zip(jobs, chapters):
+        # 알 수 없는 기록 용량은 패치 파일 크기로 추정
+        require(
+            game_path,
+            (info["write_bytes"] or info["archive_size"] or 0)
+            + (info["backup_bytes"] or 0),
+        )
+
+    cache_dir = cache.cache_dir
+    cache_volume = require(cache_dir, download_bytes)
+    if (
+        not pin_cache
+        and volumes[cache_volume]["required"] > volumes[cache_volume]["free"]
+    ):
+        for chapter, game_path in jobs:
+            volume_key, _ = get_volume_key(game_path)
+            volume = volumes[volume_key]
+            if volume_key != cache_volume and (
+                volume["required"] + download_bytes <= volume["free"]
+            ):
+                volumes[cache_volume]["required"] -= download_bytes
+                volume["required"] += download_bytes
+                # 라이브러리 최상위 폴더 (steamapps/common/게임 폴더의 세 단계 위)
+                cache_dir = (
+                    Path(game_path).parents[2] / f"{APP_DATA_DIR_NAME}_temp_cache"
+                )
+                break
+    for volume in volumes.values():
+        volume["ok"] = volume["required"] <= volume["free"]
+
+    # 다운로드와 적용은 파이프라인으로 겹쳐 진행되므로 긴 쪽에 짧은 쪽의 한 챕터 분량만 더함
+    history = load_throughput_history()
+    download_seconds = download_bytes / history["download"]
+    apply_seconds = write_bytes / history["apply"]
+    estimated_seconds = max(download_seconds, apply_seconds) + min(
+        download_seconds, apply_seconds
+    ) / max(1, len(jobs))
+
+    return {
+        "chapters": chapters,
+        "up_to_date": up_to_date,
+        "unknown_size": unknown_size,
+        "download_bytes": download_bytes,
+        "write_bytes": write_bytes,
+        "volumes": list(volumes.values()),
+        "cache_dir": str(cache_dir),
+        "ok": all(volume["ok"] for volume in volumes.values()),
+        "estimated_seconds": estimated_seconds,
+    }
+
+
+# 점검 결과 요약 메시지
+def describe_installation_plan(plan):
+    lines = [
+        f"다운로드: {format_bytes(plan['download_bytes'])}",
+        f"게임 폴더에 기록: {format_bytes(plan['write_bytes'])}",
+        f"예상 소요 시간: 약 {format_duration(plan['estimated_seconds'])}",
+    ]
+    if plan["up_to_date"]:
+        lines.append(f"이미 적용되어 건너뛸 챕터: {len(plan['up_to_date'])}개")
+    if plan["unknown_size"]:
+        lines.append(
+            f"크기를 확인하지 못한 챕터: {', '.join(plan['unknown_size'])} "
+            "(필요한 공간과 시간이 실제보다 적게 표시될 수 있습니다)"
+        )
+    for volume in plan["volumes"]:
+        lines.append(
+            f"{volume['path']}: 필요 {format_bytes(volume['required'])} / "
+            f"남은 공간 {format_bytes(volume['free'])}"
+            + ("" if volume["ok"] else " (공간 부족)")
+        )
+    return "\n".join(lines)
+
+
+# 다운로드 순서 정하기
+# smallest: 받아 둔 챕터와 작은 챕터부터, priority: 챕터의 priority 값(없으면 목록 순서), list: 목록 순서
+def order_download_jobs(jobs, order=DOWNLOAD_ORDER, cache=None, archive_sizes=None):
+    if order == "smallest":
+        archive_sizes = archive_sizes or {}
+
+        def download_size(job):
+            chapter = job[0]
+            if cache is not None and cache.get(chapter["google_drive_id"]) is not None:
+                return 0
+            size = archive_sizes.get(chapter["key"]) or chapter.get("archive_size")
+            return size if size is not None else float("inf")
+
+        return sorted(jobs, key=download_size)
+    if order == "priority":
+        return sorted(
+            jobs,
+            key=lambda job: job[0].get("priority", jobs.index(job)),
+        )
+    return list(jobs)
+
+
+# 여러 챕터를 파이프라인으로 설치
+# 다운로드 작업자 풀이 다음 챕터를 받는 동안 현재 챕터의 압축 해제와 적용을 진행합니다.
+# jobs는 (chapter, game_path) 목록이며, 적용에 성공한 챕터의 표시 이름 목록을 반환합니다.
+# event_callback(event, chapter, data)로 챕터별 상태 메시지, 다운로드/적용 진행률, 완료/실패를 알립니다.
+def run_patch_pipeline(
+    jobs,
+    progress_callback=None,
+    download_workers=DOWNLOAD_WORKERS,
+    cache=None,
+    downloader=None,
+    event_callback=None,
+    download_order=DOWNLOAD_ORDER,
+    archive_sizes=None,
+):
+    cache = cache or get_archive_cache()
+    report = get_run_report()
+
+    def chapter_callback(chapter):
+        def callback(message):
+            if progress_callback:
+                progress_callback(f"[{chapter['display_name']}] {message}")
+            if event_callback:
+                event_callback("status", chapter, {"message": message})
+
+        return callback
+
+    # 진행률 이벤트는 일정 간격으로 모아서 전달 (마지막 이벤트는 항상 전달)
+    def progress_sender(chapter, event):
+        last_sent = 0.0
+
+        def send(data, final):
+            nonlocal last_sent
+            now = time.monotonic()
+            if not final and now - last_sent < PROGRESS_EVENT_INTERVAL:
+                return
+            last_sent = now
+            event_callback(event, chapter, data)
+
+        return send
+
+    def download_hook(chapter):
+        if event_callback is None:
+            return None
+        send = progress_sender(chapter, "download_progress")
+        return lambda received, total: send(
+            {"received": received, "total": total}, received == total
+        )
+
+    def apply_hook(chapter, applied):
+        send = progress_sender(chapter, "apply_progress") if event_callback else None
+
+        def hook(files_done, files_total, bytes_done, bytes_total):
+            applied["bytes"] = bytes_done
+            if send:
+                send(
+                    {
+                        "files_done": files_done,
+                        "files_total": files_total,
+                        "bytes_done": bytes_done,
+                        "bytes_total": bytes_total,
+                    },
+                    files_done == files_total,
+                )
+
+        return hook
+
+    # 미리 받아 둘 수 있는 챕터 수를 제한하여 임시 디스크 사용량을 억제
+    prefetch_slots = threading.Semaphore(download_workers + 1)
+    ready = queue.Queue()
+    cancelled = threading.Event()
+
+    def download_job(chapter, game_path):
+        prefetch_slots.acquire()
+        if cancelled.is_set():
+            prefetch_slots.release()
+            return
+        callback = chapter_callback(chapter)
+        try:
+            cached = cache.get(chapter["google_drive_id"]) is not None
+            with report.stage("download", chapter["key"], cached=cached) as metrics:
+                started_at = time.perf_counter()
+                # 같은 구글 드라이브 ID를 쓰는 챕터는 캐시에서 한 번만 받음
+                zip_path = download_patch_archive(
+                    chapter["google_drive_id"],
+                    callback,
+                    cache,
+                    downloader,
+                    download_hook(chapter),
+                    chapter.get("archive_sha256"),
+                )
+                metrics["bytes"] = zip_path.stat().st_size
+            if not cached:
+                record_throughput(
+                    "download", metrics["bytes"], time.perf_counter() - started_at
+                )
+            ready.put((chapter, game_path, zip_path, None))
+        except Exception as e:
+            ready.put((chapter, game_path, None, e))
+
+    patched_chapters = []
+    pending_jobs = []
+    for chapter, game_path in jobs:
+        # 같은 버전의 패치가 온전히 적용되어 있으면 받지 않고 건너뜀
+        with report.stage("check_installed", chapter["key"]) as metrics:
+            metrics["up_to_date"] = is_patch_version_installed(chapter, game_path)
+        if metrics["up_to_date"]:
+            chapter_callback(chapter)(
+                "이미 같은 버전의 패치가 적용되어 있어 건너뜁니다."
+            )
+            patched_chapters.append(chapter["display_name"])
+            if event_callback:
+                event_callback(
+                    "chapter_done",
+                    chapter,
+                    {"game_path": str(game_path), "up_to_date": True},
+                )
+        else:
+            pending_jobs.append((chapter, game_path))
+    # 작은 챕터가 큰 챕터 뒤에서 기다리지 않도록 받는 순서 조정
+    jobs = order_download_jobs(pending_jobs, download_order, cache, archive_sizes)
+
+    with ThreadPoolExecutor(
+        max_workers=download_workers, thread_name_prefix="download"
+    ) as executor:
+        for chapter, game_path in jobs:
+            executor.submit(download_job, chapter, game_path)
+
+        try:
+            # 다운로드가 끝난 순서대로 적용 단계 진행
+            for _ in range(len(jobs)):
+                chapter, game_path, zip_path, error = ready.get()
+                display_name = chapter["display_name"]
+                callback = chapter_callback(chapter)
+                success = False
+                try:
+                    if error is not None:
+                        raise error
+                    applied = {"bytes": 0}
+                    started_at = time.perf_counter()
+                    with report.stage("apply", chapter["key"]) as metrics:
+                        success = apply_patch_archive(
+                            zip_path,
+                            game_path,
+                            callback,
+                            chapter.get("special_handling", False),
+                            zip_path.stem,
+                            apply_hook(chapter, applied),
+                            chapter.get("patch_version"),
+                            metrics,
+                        )
+                        metrics["success"] = success
+                    if success:
+                        patched_chapters.append(display_name)
+                        record_throughput(
+                            "apply", applied["bytes"], time.perf_counter() - started_at
+                        )
+                except zipfile.BadZipFile as e:
+                    # 손상된 파일은 캐시에서 지워 다음 실행에서 다시 받음
+                    cache.discard(chapter["google_drive_id"])
+                    callback(
+                        f"패치 파일이 손상되어 캐시에서 삭제하였습니다. "
+                        f"다시 시도해 주십시오: {e}"
+                    )
+                except Exception as e:
+                    callback(f"패치 적용 중 문제가 발생하였습니다: {e}")
+                finally:
+                    prefetch_slots.release()
+                if event_callback:
+                    event_callback(
+                        "chapter_done" if success else "chapter_failed",
+                        chapter,
+                        {"game_path": str(game_path)},
+                    )
+        finally:
+            # 예외로 중단된 경우 대기 중인 다운로드가 시작되지 않도록 처리
+            cancelled.set()
+            for _ in range(len(jobs)):
+                prefetch_slots.release()
+
+    return patched_chapters
+
+
+# Steamgrid 이미지 하나를 대상 경로에 배치
+# 이미 같은 파일이 있으면 건너뛰고, 가능하면 하드 링크를 만들며 안 되면 복사합니다.
+def deploy_steamgrid_file(source, target, source_hash):
+    source_stat = source.stat()
+    try:
+        target_stat = target.stat()
+    except FileNotFoundError:
+        target_stat = None
+
+    # 크기가 같으면 같은 파일(하드 링크), 수정 시각, 해시 순서로 동일 여부 확인
+    if target_stat is not None and target_stat.st_size == source_stat.st_size:
+        if (
+            os.path.samestat(source_stat, target_stat)
+            or target_stat.st_mtime_ns == source_stat.st_mtime_ns
+            or compute_file_sha256(target) == source_hash(source)
+        ):
+            return "skipped"
+
+    # 임시 이름으로 만든 뒤 교체하여 중간에 실패해도 기존 이미지가 깨지지 않도록 처리
+    temp_path = target.with_name(f"{target.name}.tmp")
+    temp_path.unlink(missing_ok=True)
+    try:
+        os.link(source, temp_path)
+        result = "linked"
+    except OSError:
+        # 다른 드라이브이거나 하드 링크를 지원하지 않는 파일 시스템
+        shutil.copy2(source, temp_path)
+        result = "copied"
+    os.replace(temp_path, target)
+    return result
+
+
+# Steamgrid 이미지 적용 (소요 시간과 결과를 실행 보고서에 기록)
+def apply_steamgrid_images(steam_path, max_workers=STEAMGRID_WORKERS):
+    with get_run_report().stage("steamgrid") as metrics:
+        results = deploy_steamgrid_images(steam_path, max_workers)
+        metrics.update(results)
+        metrics["files"] = sum(results.values())
+    return results
+
+
+# 모든 Steam 사용자 폴더에 Steamgrid 이미지 배치
+# 사용자 폴더별로 작업을 나누어 동시에 처리하고, 건너뜀/링크/복사/실패 수를 반환합니다.
+def deploy_steamgrid_images(steam_path, max_workers=STEAMGRID_WORKERS):
+    # 사용자 데이터 경로
+    user_data_dir = Path(steam_path) / "userdata"
+    steamgrid_source = resource_path("Steamgrid")
+    results = {"skipped": 0, "linked": 0, "copied": 0, "failed": 0}
+
+    if not steamgrid_source.exists():
+        logger.error(f"Steamgrid 이미지를 찾을 수 없습니다. 경로: {steamgrid_source}")
+        return results
+
+    image_files = list(steamgrid_source.glob("*.*"))
+    user_dirs = (
+        [user_dir for user_dir in user_data_dir.iterdir() if user_dir.is_dir()]
+        if user_data_dir.exists()
+        else []
+    )
+
+    # 원본 이미지의 해시는 필요할 때 한 번만 계산
+    source_hashes = {}
+    hash_lock = threading.Lock()
+
+    def source_hash(image_file):
+        with hash_lock:
+            if image_file not in source_hashes:
+                source_hashes[image_file] = compute_file_sha256(image_file)
+            return source_hashes[image_file]
+
+    # 각 사용자의 Steamgrid 이미지 경로에 이미지 배치
+    def deploy_to_user(user_dir):
+        user_results = {key: 0 for key in results}
+        grid_destination = user_dir / "config" / "grid"
+        grid_destination.mkdir(parents=True, exist_ok=True)
+
+        for image_file in image_files:
+            target_image_path = grid_destination / image_file.name
+            try:
+                result = deploy_steamgrid_file(
+                    image_file, target_image_path, source_hash
+                )
+            except Exception as e:
+                logger.warning(
+                    f"이미지 복사 중 오류 발생: {image_file} -> {target_image_path}, 오류 메시지: {e}"
+                )
+                result = "failed"
+            user_results[result] += 1
+        return user_results
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="steamgrid"
+    ) as executor:
+        for user_results in executor.map(deploy_to_user, user_dirs):
+            for key, count in user_results.items():
+                results[key] += count
+
+    logger.info(
+        f"Steamgrid 이미지 적용 결과 ({len(user_dirs)}개 사용자 폴더): "
+        f"동일하여 건너뜀 {results['skipped']}개, 하드 링크 {results['linked']}개, "
+        f"복사 {results['copied']}개, 실패 {results['failed']}개"
+    )
+    return results
+
+
+# 작업 스레드에서 UI로 진행 상황을 전달하는 이벤트 큐
+# 작업 스레드는 post/call만 사용하고, UI는 root.after로 주기적으로 drain하여 한 번에 반영합니다.
+class ProgressBus:
+    def __init__(self):
+        self._queue = queue.Queue()
+
+    # 이벤트 전달 (run_patch_pipeline의 event_callback으로 그대로 사용 가능)
+    def post(self, event, chapter=None, data=None):
+        self._queue.put((event, chapter, data or {}))
+
+    # UI 스레드에서 실행할 함수 전달
+    def call(self, func, *args):
+        self._queue.put(("call", None, {"func": func, "args": args}))
+
+    # 쌓인 이벤트를 모두 꺼냄
+    def drain(self):
+        events = []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                return events
+
+
+# 바이트 수를 읽기 쉬운 단위로 표시
+def format_bytes(byte_count):
+    for unit in ("B", "KB", "MB"):
+        if byte_count < 1024:
+            return f"{byte_count:.1f} {unit}"
+        byte_count /= 1024
+    return f"{byte_count:.1f} GB"
+
+
+# GUI 설정
+class PatchInstallerUI:
+    def __init__(self, root, chapters, library_index=None, mirror_sources=None):
+        self.root = root
+        self.root.title("쓰르라미 울 적에 한글 패치 마법사")
+        self.root.geometry("750x560")  # 창 크기 조정
+        # Steam 경로와 라이브러리는 백그라운드 확인이 끝나면 채워짐
+        self.steam_path = None
+        self.library_index = library_index
+        self.discovery_finished = library_index is not None
+        self.mirror_sources = mirror_sources
+        self.time_to_first_window = None
+
+        # 작업 스레드의 진행 상황은 이벤트 큐를 통해서만 UI에 반영
+        self.progress_bus = ProgressBus()
+        self.chapter_progress = {}
+        self.transfer_started = {}
+
+        # 다크 모드 여부 감지
+        self.is_dark_mode = is_windows_dark_mode()
+
+        # Sun Valley 테마 적용
+        import sv_ttk
+
+        sv_ttk.set_theme("dark" if self.is_dark_mode else "light")
+
+        # 아이콘 설정
+        icon_path = resource_path("ICO.ico")
+        try:
+            from PIL import ImageTk
+
+            # 작업표시줄 아이콘 적용을 위해 PhotoImage 사용
+            icon_img = ImageTk.PhotoImage(file=icon_path)
+            self.root.iconphoto(False, icon_img)
+        except Exception as e:
+            logger.warning(f"아이콘 설정 중 오류 발생: {e}")
+
+        # 기본 폰트 설정 (맑은 고딕 사용)
+        self.custom_font = ("맑은 고딕", 12)
+
+        # ttk 스타일에 기본 폰트 적용
+        style = ttk.Style()
+        style.configure(".", font=self.custom_font)
+        style.configure("TLabel", font=self.custom_font)
+        style.configure("TButton", font=self.custom_font)
+        style.configure("TCheckbutton", font=self.custom_font)
+
+        self.selected_chapters = []
+        self.chapters = chapters
+
+        # 이미지 추가 (이미지 크기 조정 포함)
+        try:
+            from PIL import Image, ImageTk
+
+            image_path = resource_path("IMG.png")
+            self.header_image = Image.open(image_path)
+            # 이미지 크기 조정 (너무 크다면 줄여줌)
+            self.header_image = self.header_image.resize((500, 163), Image.LANCZOS)
+            self.header_image_tk = ImageTk.PhotoImage(self.header_image)
+
+            # 이미지 레이블 생성
+            header_label = tk.Label(self.root, image=self.header_image_tk)
+            header_label.pack(pady=10)
+        except Exception as e:
+            logger.warning(f"이미지 로드 중 오류 발생: {e}")
+
+        self.create_widgets()
+
+        # 첫 창 표시 시각 측정
+        self.root.bind("<Map>", self.on_first_map, add="+")
+
+        # 진행 상황 이벤트 확인 시작
+        self.root.after(PROGRESS_POLL_INTERVAL_MS, self.poll_progress)
+
+    def create_widgets(self):
+        # 제목 레이블
+        title_label = ttk.Label(
+            self.root,
+            text="어떤 챕터에 패치를 적용할지 선택해 주십시오.",
+            justify="center",
+        )
+        title_label.pack(pady=10)
+
+        # 체크 버튼 목록 (한 열에 CHAPTERS_PER_COLUMN개씩 나눔)
+        self.chapter_vars = []
+        self.chapter_checks = []
+
+        # 체크 버튼들을 담을 프레임을 중앙에 배치
+        main_frame = ttk.Frame(self.root)
+        main_frame.pack(pady=20)
+
+        # 챕터 수에 맞춰 열을 만들고 순서대로 채움
+        column_frames = []
+        for idx, chapter in enumerate(self.chapters):
+            column = idx // CHAPTERS_PER_COLUMN
+            if column == len(column_frames):
+                column_frame = ttk.Frame(main_frame)
+                column_frame.grid(row=0, column=column, padx=20, sticky="n")
+                column_frames.append(column_frame)
+            var = tk.BooleanVar(value=chapter.get("installed", False))
+            self.chapter_vars.append(var)
+            chk = ttk.Checkbutton(
+                column_frames[column],
+                text=chapter["display_name"],
+                variable=var,
+            )
+            chk.pack(anchor="w")
+            self.chapter_checks.append(chk)
+
+        # 진행 상태 표시 레이블
+        self.status_label = ttk.Label(self.root, text="")
+        self.status_label.pack(pady=(20, 5))
+
+        # 전체 진행률과 현재 작업의 속도/남은 시간
+        self.progress_bar = ttk.Progressbar(
+            self.root, length=500, mode="determinate", maximum=100
+        )
+        self.progress_bar.pack(pady=5)
+        self.detail_label = ttk.Label(self.root, text="")
+        self.detail_label.pack(pady=(0, 10))
+
+        # 설치 및 제거 버튼
+        button_frame = ttk.Frame(self.root)
+        button_frame.pack(pady=10)
+        self.install_btn = ttk.Button(
+            button_frame, text="한글 패치 설치", command=self.start_installation_thread
+        )
+        self.install_btn.grid(row=0, column=0, padx=10)
+        self.uninstall_btn = ttk.Button(
+            button_frame, text="한글 패치 제거", command=self.start_uninstall_thread
+        )
+        self.uninstall_btn.grid(row=0, column=1, padx=10)
+        if self.library_index is None:
+            # 라이브러리 확인이 끝날 때까지 설치/제거 버튼 비활성화
+            self.install_btn.state(["disabled"])
+            self.uninstall_btn.state(["disabled"])
+            self.status_label.config(text="설치된 챕터를 확인하고 있습니다.")
+
+    def on_first_map(self, event):
+        if event.widget is not self.root or self.time_to_first_window is not None:
+            return
+        self.time_to_first_window = time.perf_counter() - PROCESS_START_TIME
+        logger.info(f"첫 창 표시까지 걸린 시간: {self.time_to_first_window:.3f}초")
+        if self.time_to_first_window > STARTUP_BUDGET_SECONDS:
+            logger.warning(
+                f"첫 창 표시가 목표 시간({STARTUP_BUDGET_SECONDS}초)을 초과하였습니다."
+            )
+
+    # 업데이트 확인과 Steam 라이브러리 확인을 백그라운드에서 시작
+    def start_background_startup(self):
+        threading.Thread(target=self.check_updates_task, daemon=True).start()
+        threading.Thread(target=self.refresh_chapters_task, daemon=True).start()
+        threading.Thread(target=self.discover_steam_task, daemon=True).start()
+        self.root.after(STEAM_DISCOVERY_TIMEOUT * 1000, self.on_discovery_timeout)
+
+    def check_updates_task(self):
+        with get_run_report().stage("update_check") as metrics:
+            metrics["update_available"] = check_for_updates(__version__)
+        if metrics["update_available"]:
+            self.progress_bus.call(self.notify_update)
+
+    # 원격 챕터 목록이 바뀌었으면 구글 드라이브 ID와 패치 버전 등을 갱신
+    # 새로 추가된 챕터는 다음 실행부터 목록에 표시됩니다.
+    def refresh_chapters_task(self):
+        manifest = fetch_chapter_manifest()
+        if manifest is not None:
+            self.progress_bus.call(self.update_chapters, build_chapter_list(manifest))
+
+    def update_chapters(self, chapters):
+        latest_chapters = {chapter["key"]: chapter for chapter in chapters}
+        for chapter in self.chapters:
+            latest = latest_chapters.get(chapter["key"])
+            if latest is not None:
+                chapter.update(latest)
+
+    def notify_update(self):
+        # 업데이트가 있으면 웹사이트를 엽니다.
+        messagebox.showinfo(
+            "업데이트 알림", "새로운 버전이 있습니다. 다운로드 페이지를 엽니다."
+        )
+        webbrowser.open(
+            "https://github.com/munsy0227/Higurashi-Auto-KR-Patcher/releases/latest"
+        )
+
+    def discover_steam_task(self):
+        # Steam 설치 경로 찾기
+        steam_path = get_steam_install_path()
+        if not steam_path:
+            self.progress_bus.call(
+                self.show_fatal_error, "Steam 설치 경로를 확인할 수 없습니다."
+            )
+            return
+
+        # Steam 라이브러리 폴더 찾기
+        library_paths = get_steam_library_folders(steam_path)
+        if not library_paths:
+            self.progress_bus.call(
+                self.show_fatal_error, "Steam 라이브러리 폴더를 찾을 수 없습니다."
+            )
+            return
+
+        # 라이브러리의 앱 목록을 한 번에 읽어 색인 생성
+        with get_run_report().stage(
+            "discovery", libraries=len(library_paths)
+        ) as metrics:
+            library_index = load_steam_library_index(steam_path, library_paths)
+            metrics["apps"] = len(library_index["apps"])
+        self.progress_bus.call(self.set_library_index, steam_path, library_index)
+
+        # 설치된 챕터 자동 감지 (감지되는 대로 체크 버튼에 반영)
+        for idx, chapter in enumerate(self.chapters):
+            game_path = find_game_install_path(library_index, chapter)
+            self.progress_bus.call(
+                self.set_chapter_installed, idx, game_path is not None
+            )
+        self.progress_bus.call(self.on_discovery_finished)
+
+        # 설치된 챕터의 한글 패치 적용 상태 확인
+        # 색인은 UI 스레드에 아직 반영되지 않았을 수 있으므로 직접 전달
+        self.verify_chapters_task(self.chapters, library_index)
+
+    # 한글 패치 적용 상태를 확인하여 체크 버튼 옆에 표시
+    def start_verification(self, chapters):
+        threading.Thread(
+            target=self.verify_chapters_task,
+            args=(chapters, self.library_index),
+            daemon=True,
+        ).start()
+
+    def verify_chapters_task(self, chapters, library_index):
+        cache = get_archive_cache()
+        for chapter in chapters:
+            game_path = find_game_install_path(library_index, chapter)
+            if not game_path or not game_path.exists():
+                continue
+            try:
+                # 받아 둔 패치 파일이 있으면 그 목록과 비교 (없으면 설치 목록과 비교)
+                zip_path = cache.get(chapter["google_drive_id"])
+                result = verify_patch_installation(
+                    game_path,
+                    zip_path,
+                    chapter.get("special_handling", False),
+                    # 캐시 파일 이름이 곧 내용의 SHA-256
+                    archive_hash=zip_path.stem if zip_path else None,
+                    patch_version=chapter.get("patch_version"),
+                )
+            except Exception as e:
+                logger.warning(
+                    f"{chapter['display_name']} 패치 상태 확인 중 오류 발생: {e}"
+                )
+                continue
+            self.progress_bus.call(
+                self.set_chapter_patch_status, chapter, result["status"]
+            )
+
+    def set_chapter_patch_status(self, chapter, status):
+        idx = self.chapters.index(chapter)
+        chapter["patch_status"] = status
+        self.chapter_checks[idx].config(
+            text=f"{chapter['display_name']} ({PATCH_STATUS_LABELS[status]})"
+        )
+
+    def set_library_index(self, steam_path, library_index):
+        self.steam_path = steam_path
+        self.library_index = library_index
+        self.install_btn.state(["!disabled"])
+        self.uninstall_btn.state(["!disabled"])
+
+    def set_chapter_installed(self, idx, installed):
+        self.chapters[idx]["installed"] = installed
+        self.chapter_vars[idx].set(installed)
+
+    def on_discovery_finished(self):
+        self.discovery_finished = True
+        self.status_label.config(text="")
+
+    def on_discovery_timeout(self):
+        if not self.discovery_finished:
+            self.status_label.config(
+                text="Steam 라이브러리 확인이 지연되고 있습니다. 확인되는 대로 챕터 목록에 반영합니다."
+            )
+
+    def show_fatal_error(self, message):
+        messagebox.showerror("오류", message)
+        self.root.destroy()
+
+    def update_status(self, message):
+        # 작업 스레드에서 호출되므로 이벤트 큐에 넣고 UI 스레드에서 반영
+        self.progress_bus.post("status", data={"message": message})
+
+    # 이벤트 큐를 비우고 상태 레이블과 진행률 막대를 한 번에 갱신
+    # 짧은 간격으로 들어온 진행률 이벤트는 마지막 값만 반영합니다.
+    def poll_progress(self):
+        try:
+            self.apply_progress_events()
+        finally:
+            self.root.after(PROGRESS_POLL_INTERVAL_MS, self.poll_progress)
+
+    def apply_progress_events(self):
+        status_message = None
+        latest_transfer = None
+        for event, chapter, data in self.progress_bus.drain():
+            if event == "call":
+                data["func"](*data["args"])
+            elif event == "status":
+                status_message = data["message"]
+                if chapter is not None:
+                    status_message = f"[{chapter['display_name']}] {status_message}"
+            elif event == "pipeline_start":
+                self.chapter_progress = {key: 0.0 for key in data["chapters"]}
+                self.transfer_started = {}
+                self.detail_label.config(text="")
+            elif event in ("download_progress", "apply_progress"):
+                self.update_chapter_progress(event, chapter, data)
+                latest_transfer = (event, chapter, data)
+            elif event in ("chapter_done", "chapter_failed"):
+                self.chapter_progress[chapter["key"]] = 1.0
+
+        if status_message is not None:
+            self.status_label.config(text=status_message)
+        if latest_transfer is not None:
+            self.detail_label.config(text=self.format_transfer(*latest_transfer))
+        if self.chapter_progress:
+            self.progress_bar["value"] = (
+                sum(self.chapter_progress.values()) / len(self.chapter_progress) * 100
+            )
+
+    # 챕터별 진행률: 다운로드 0~50%, 적용 50~100%
+    def update_chapter_progress(self, event, chapter, data):
+        if event == "download_progress":
+            fraction = data["received"] / data["total"] if data["total"] else 0.0
+            progress = fraction * 0.5
+        else:
+            fraction = (
+                data["files_done"] / data["files_total"] if data["files_total"] else 1.0
+            )
+            progress = 0.5 + fraction * 0.5
+        self.chapter_progress[chapter["key"]] = progress
 
+    # 현재 작업의 진행량, 처리 속도, 남은 시간 표시
+    def format_transfer(self, event, chapter, data):
+        if event == "download_progress":
+            done, total = data["received"], data["total"]
+            label = "다운로드"
+            amount = f"{format_bytes(done)} / {format_bytes(total or 0)}"
+        else:
+            done, total = data["bytes_done"], data["bytes_total"]
+            label = "적용"
+            amount = f"파일 {data['files_done']} / {data['files_total']}개"
+
+        now = time.monotonic()
+        started_at, started_done = self.transfer_started.setdefault(
+            (chapter["key"], event), (now, done)
+        )
+        elapsed = now - started_at
+        speed = (done - started_done) / elapsed if elapsed > 0 else 0.0
+        text = f"[{chapter['display_name']}] {label} {amount}"
+        if speed > 0:
+            text += f" · {format_bytes(speed)}/s"
+            if total:
+                text += f" · 남은 시간 {max(0, total - done) / speed:.0f}초"
+        if event == "download_progress":
+            # 여러 챕터를 동시에 받을 때 전체 속도와 제한 표시
+            stats = get_download_scheduler().stats()
+            text += f" · 전체 {format_bytes(stats['current_speed'])}/s"
+            if stats["rate_limit"]:
+                text += f" (제한 {format_bytes(stats['rate_limit'])}/s)"
+        return text
+
+    def set_buttons_enabled(self, enabled):
+        state = ["!disabled"] if enabled else ["disabled"]
+        self.install_btn.state(state)
+        self.uninstall_btn.state(state)
+
+    def start_installation_thread(self):
+        # 선택된 챕터 수집
+        self.selected_chapters = [
+            self.chapters[idx] for idx, var in enumerate(self.chapter_vars) if var.get()
+        ]
+
+        if not self.selected_chapters:
+            messagebox.showwarning(
+                "경고",
+                "설치할 챕터를 선택하지 않으셨습니다. 챕터를 선택해 주시기 바랍니다.",
+            )
+            return
+
+        # 설치 작업을 별도의 스레드에서 실행
+        self.set_buttons_enabled(False)
+        install_thread = threading.Thread(target=self.start_installation)
+        install_thread.start()
+
+    def start_installation(self):
+        # 설치 경로를 확인한 챕터만 파이프라인에 추가
+        jobs = []
         for chapter in self.selected_chapters:
-            folder_name = chapter["name"]
             display_name = chapter["display_name"]
-            game_path = find_game_install_path_by_name(self.library_paths, folder_name)
-            if not game_path:
+            game_path = find_game_install_path(self.library_index, chapter)
+            # 색인 이후 삭제된 게임에 새 폴더를 만들지 않도록 실제 경로 확인
+            if not game_path or not game_path.exists():
                 self.update_status(
                     f"{display_name} 폴더를 찾을 수 없어 건너뛰었습니다."
                 )
@@ -419,22 +3370,79 @@ class PatchInstallerUI:
             self.update_status(
                 f"{display_name}의 설치 경로를 확인하였습니다. 경로: {game_path}"
             )
+            jobs.append((chapter, game_path))
 
-            try:
-                special_handling = chapter.get("special_handling", False)
-                success = apply_patch_from_zip(
-                    chapter["google_drive_id"],
-                    game_path,
-                    self.update_status,
-                    special_handling,
-                )
-                if success:
-                    patched_chapters.append(display_name)
-            except Exception as e:
-                self.update_status(
-                    f"{display_name}에 패치 적용 중 문제가 발생하였습니다: {e}"
-                )
+        # 다운로드 전에 필요한 공간과 예상 시간 확인
+        self.update_status("필요한 디스크 공간과 예상 소요 시간을 확인하고 있습니다.")
+        try:
+            plan = plan_installation(jobs, mirror_sources=self.mirror_sources)
+        except Exception as e:
+            logger.warning(f"설치 전 점검 중 오류 발생: {e}")
+            plan = None
+        self.progress_bus.call(self.confirm_installation, jobs, plan)
 
+    def confirm_installation(self, jobs, plan):
+        if plan is not None and not plan["ok"]:
+            messagebox.showerror(
+                "공간 부족",
+                "디스크 공간이 부족하여 패치를 설치할 수 없습니다.\n\n"
+                + describe_installation_plan(plan),
+            )
+            self.set_buttons_enabled(True)
+            return
+        if plan is not None and not messagebox.askyesno(
+            "설치 확인",
+            describe_installation_plan(plan) + "\n\n패치를 설치하시겠습니까?",
+        ):
+            self.set_buttons_enabled(True)
+            return
+        cache = get_archive_cache()
+        if plan is not None and Path(plan["cache_dir"]) != cache.cache_dir:
+            # 캐시 드라이브의 공간이 부족하면 게임이 있는 드라이브에 임시로 받음
+            # (기본 캐시에 이미 받아 둔 파일은 그대로 사용)
+            cache = ArchiveCache(plan["cache_dir"], fallback=cache, temporary=True)
+        archive_sizes = (
+            {info["chapter"]: info["archive_size"] for info in plan["chapters"]}
+            if plan is not None
+            else None
+        )
+        threading.Thread(
+            target=self.run_installation, args=(jobs, cache, archive_sizes)
+        ).start()
+
+    def run_installation(self, jobs, cache, archive_sizes=None):
+        # 패치 설치 시작
+        self.progress_bus.post(
+            "pipeline_start", data={"chapters": [chapter["key"] for chapter, _ in jobs]}
+        )
+        downloader = None
+        if self.mirror_sources:
+            downloader = make_mirror_downloader(
+                self.mirror_sources,
+                expected_hashes={
+                    chapter["google_drive_id"]: chapter.get("archive_sha256")
+                    for chapter, _ in jobs
+                },
+            )
+        try:
+            patched_chapters = run_patch_pipeline(
+                jobs,
+                cache=cache,
+                downloader=downloader,
+                event_callback=self.progress_bus.post,
+                archive_sizes=archive_sizes,
+            )
+        finally:
+            # 공간이 부족한 드라이브를 피해 임시로 받은 파일은 설치 후 삭제
+            if cache.temporary:
+                cache.remove()
+        # 창을 닫기 전에도 보고서를 확인할 수 있도록 설치가 끝날 때마다 저장
+        write_run_report()
+        self.progress_bus.call(self.show_installation_result, patched_chapters)
+
+    def show_installation_result(self, patched_chapters):
+        self.set_buttons_enabled(True)
+        self.start_verification(self.selected_chapters)
         # 결과 표시
         if patched_chapters:
             messagebox.showinfo(
@@ -445,99 +3453,674 @@ class PatchInstallerUI:
         else:
             messagebox.showinfo("완료", "패치가 적용된 챕터가 없습니다.")
 
+    def start_uninstall_thread(self):
+        # 선택된 챕터 수집
+        selected_chapters = [
+            self.chapters[idx] for idx, var in enumerate(self.chapter_vars) if var.get()
+        ]
+        if not selected_chapters:
+            messagebox.showwarning(
+                "경고",
+                "제거할 챕터를 선택하지 않으셨습니다. 챕터를 선택해 주시기 바랍니다.",
+            )
+            return
+        if not messagebox.askyesno(
+            "확인", "선택한 챕터의 한글 패치를 제거하고 원본 파일을 복원하시겠습니까?"
+        ):
+            return
 
-# 메인 실행
-if __name__ == "__main__":
-    # 작업표시줄 아이콘 설정
-    set_app_user_model_id()
+        # 제거 작업을 별도의 스레드에서 실행
+        self.set_buttons_enabled(False)
+        uninstall_thread = threading.Thread(
+            target=self.start_uninstall, args=(selected_chapters,)
+        )
+        uninstall_thread.start()
 
-    # 업데이트 확인 추가된 부분
-    if check_for_updates(__version__):
-        # 업데이트가 있으면 웹사이트를 엽니다.
-        messagebox.showinfo(
-            "업데이트 알림", "새로운 버전이 있습니다. 다운로드 페이지를 엽니다."
+    def start_uninstall(self, selected_chapters):
+        removed_chapters = []
+        for chapter in selected_chapters:
+            display_name = chapter["display_name"]
+            game_path = find_game_install_path(self.library_index, chapter)
+            if not game_path or not game_path.exists():
+                self.update_status(
+                    f"{display_name} 폴더를 찾을 수 없어 건너뛰었습니다."
+                )
+                continue
+            try:
+                if uninstall_patch(
+                    game_path,
+                    lambda message: self.update_status(f"[{display_name}] {message}"),
+                ):
+                    removed_chapters.append(display_name)
+            except Exception as e:
+                self.update_status(
+                    f"{display_name}의 한글 패치 제거 중 문제가 발생하였습니다: {e}"
+                )
+        self.progress_bus.call(
+            self.show_uninstall_result, removed_chapters, selected_chapters
         )
-        webbrowser.open(
-            "https://github.com/munsy0227/Higurashi-Auto-KR-Patcher/releases/latest"
+
+    def show_uninstall_result(self, removed_chapters, selected_chapters):
+        self.set_buttons_enabled(True)
+        self.start_verification(selected_chapters)
+        # 결과 표시
+        if removed_chapters:
+            messagebox.showinfo(
+                "완료",
+                "다음 챕터의 한글 패치를 제거하였습니다.\n"
+                + "\n".join(removed_chapters),
+            )
+        else:
+            messagebox.showinfo("완료", "한글 패치를 제거한 챕터가 없습니다.")
+
+
+# HTTP 주소인 미러인지 확인
+def is_http_source(source):
+    return str(source).lower().startswith(("http://", "https://"))
+
+
+# 미러에서 패치 파일 크기와 읽기용 파일 객체 찾기 (설치 전 점검용)
+# 처음으로 파일이 있는 미러의 (미러, 크기, 파일 객체)를 반환하며, 파일 객체는 HTTP 미러가
+# 구간 요청을 지원하지 않으면 None입니다. 어느 미러에도 없으면 None을 반환합니다.
+def open_mirror_archive(mirror_sources, file_id, session=None):
+    session = session or get_http_session()
+    for source in mirror_sources or ():
+        try:
+            if is_http_source(source):
+                url = f"{str(source).rstrip('/')}/{file_id}.zip"
+                with session.head(url, timeout=DOWNLOAD_TIMEOUT) as response:
+                    if response.status_code == 404:
+                        continue
+                size, accepts_ranges = probe_download(session, url)
+                reader = (
+                    HttpRangeReader(session, url, size)
+                    if size and accepts_ranges
+                    else None
+                )
+                return source, size, reader
+            mirror_path = Path(source) / f"{file_id}.zip"
+            if mirror_path.is_file():
+                return source, mirror_path.stat().st_size, open(mirror_path, "rb")
+        except Exception as e:
+            logger.warning(
+                f"미러에서 패치 파일 정보를 확인하지 못했습니다: {source}, {e}"
+            )
+    return None
+
+
+# 미러 하나에서 패치 파일 받기
+# 미러에 파일이 있으면 미러가 알려 준 SHA-256('<ID>.zip.sha256', 없으면 빈 문자열)을, 없으면 None을 반환합니다.
+def fetch_from_mirror(source, file_id, destination, progress_hook=None, scheduler=None):
+    if is_http_source(source):
+        url = f"{str(source).rstrip('/')}/{file_id}.zip"
+        session = get_http_session()
+        # 미러에 있는지는 ZIP 파일로 판단하고, '.sha256' 파일은 없어도 됨
+        with session.head(url, timeout=DOWNLOAD_TIMEOUT) as response:
+            if response.status_code == 404:
+                return None
+        with session.get(f"{url}.sha256", timeout=DOWNLOAD_TIMEOUT) as response:
+            published_hash = (
+                response.text.split()[0].lower()
+                if response.ok and response.text.strip()
+                else ""
+            )
+        download_file(
+            url,
+            destination,
+            session=session,
+            progress_hook=progress_hook,
+            resume_key=f"mirror:{url}",
+            scheduler=scheduler,
         )
+        return published_hash
 
-    # 챕터 정보
-    chapters = [
-        {
-            "name": "Higurashi When They Cry",
-            "display_name": "오니카쿠시 편 (챕터 1)",
-            "google_drive_id": "1J2FmtLdf72iU0M8PY7WE6L_DVU2ziw3S",
-        },
-        {
-            "name": "Higurashi 02 - Watanagashi",
-            "display_name": "와타나가시 편 (챕터 2)",
-            "google_drive_id": "1KrEgh4CvKDP4DPulR3GIqGo_Ms1ciCkm",
-        },
-        {
-            "name": "Higurashi 03 - Tatarigoroshi",
-            "display_name": "타타리고로시 편 (챕터 3)",
-            "google_drive_id": "1XFiYcOQt41s57GKPsLbrC8kblJwHG2D5",
-        },
-        {
-            "name": "Higurashi 04 - Himatsubushi",
-            "display_name": "히마츠부시 편 (챕터 4)",
-            "google_drive_id": "1Z6SJLRZO8KkYIQs_C3BVnWfaWWrL4poa",
-        },
-        {
-            "name": "Higurashi When They Cry Hou - Ch. 5 Meakashi",
-            "display_name": "메아카시 편 (챕터 5)",
-            "google_drive_id": "1K25opRd1HtJGWLl9DWzcsvWMKqaZaU_P",
-        },
-        {
-            "name": "Higurashi When They Cry Hou - Ch.6 Tsumihoroboshi",
-            "display_name": "츠미호로보시 편 (챕터 6)",
-            "google_drive_id": "1si3l8EYlZFfI8DVtpJT4WAY_I0VEEnEz",
-        },
-        {
-            "name": "Higurashi When They Cry Hou - Ch.7 Minagoroshi",
-            "display_name": "미나고로시 편 (챕터 7)",
-            "google_drive_id": "1AsbW4Oozy76YySHRIQT0sp3rSejryDp8",
-        },
-        {
-            "name": "Higurashi When They Cry Hou - Ch.8 Matsuribayashi",
-            "display_name": "마츠리바야시 편 (챕터 8)",
-            "google_drive_id": "1si3l8EYlZFfI8DVtpJT4WAY_I0VEEnEz",
-        },
-        {
-            "name": "Higurashi When They Cry Hou - Rei",
-            "display_name": "쓰르라미 울 적에 례",
-            "google_drive_id": "13wdP3jz5FvaVi0PBZ_6WsiCK591VkEYS",
-        },
-        {
-            "name": "Higurashi When They Cry Hou+",
-            "display_name": "쓰르라미 울 적에 봉+",
-            "google_drive_id": "1kAA5JDB-gFa_mEglHqAvvt8SFV7s3Npb",
-            "special_handling": True,
-        },
-    ]
+    mirror_path = Path(source) / f"{file_id}.zip"
+    if not mirror_path.is_file():
+        return None
+    hash_path = mirror_path.with_name(mirror_path.name + ".sha256")
+    published_hash = (
+        hash_path.read_text(encoding="utf-8").split()[0].lower()
+        if hash_path.is_file()
+        else ""
+    )
+    total = mirror_path.stat().st_size
+    copied = 0
+    with open(mirror_path, "rb") as source_file, open(destination, "wb") as target:
+        for chunk in iter(lambda: source_file.read(COPY_BUFFER_SIZE), b""):
+            target.write(chunk)
+            copied += len(chunk)
+            if progress_hook:
+                progress_hook(copied, total)
+    return published_hash
 
-    # Steam 설치 경로 찾기
-    steam_path = get_steam_install_path()
-    if not steam_path:
-        messagebox.showerror("오류", "Steam 설치 경로를 확인할 수 없습니다.")
-        exit()
 
-    # Steam 라이브러리 폴더 찾기
+# 로컬 미러를 먼저 확인하는 다운로더 만들기
+# 미러는 폴더 또는 HTTP 주소이며 '<구글 드라이브 ID>.zip' 파일을 제공합니다 (--serve 모드의 주소도 사용 가능).
+# 받은 파일은 챕터 목록과 미러의 SHA-256으로 확인하고, 없거나 일치하지 않으면 다음 미러를 거쳐 fallback으로 받습니다.
+def make_mirror_downloader(
+    mirror_sources, fallback=download_from_google_drive, expected_hashes=None
+):
+    if isinstance(mirror_sources, (str, Path)):
+        mirror_sources = [mirror_sources]
+    expected_hashes = expected_hashes or {}
+    # 같은 네트워크 안의 전송에는 인터넷 속도 제한을 적용하지 않음
+    scheduler = DownloadScheduler(rate_limit=0)
+
+    def downloader(file_id, destination, progress_callback=None, progress_hook=None):
+        destination = Path(destination)
+        for source in mirror_sources:
+            try:
+                published_hash = fetch_from_mirror(
+                    source, file_id, destination, progress_hook, scheduler
+                )
+                if published_hash is None:
+                    continue
+                actual_hash = compute_file_sha256(destination)
+                expected_hash = expected_hashes.get(file_id)
+                for known_hash in (expected_hash, published_hash):
+                    if known_hash and known_hash != actual_hash:
+                        raise DownloadError("미러의 파일 해시가 일치하지 않습니다.")
+                message = f"로컬 미러에서 패치 파일을 가져왔습니다: {source}"
+                if not expected_hash:
+                    # 챕터 목록에 해시가 없으면 미러가 알려 준 해시(또는 ZIP 구조)로만 확인됨
+                    message += " (챕터 목록에 해시가 없어 원본과 같은 파일인지 확인하지 못했습니다" + (
+                        ", 미러의 해시와는 일치합니다)" if published_hash else ")"
+                    )
+                    logger.warning(
+                        f"확인되지 않은 미러 파일을 사용합니다: {source}, {file_id}, "
+                        f"SHA-256 {actual_hash}"
+                    )
+                if progress_callback:
+                    progress_callback(message)
+                return
+            except Exception as e:
+                logger.warning(
+                    f"미러에서 패치 파일을 가져오지 못했습니다: {source}, {e}"
+                )
+                destination.unlink(missing_ok=True)
+        fallback(file_id, destination, progress_callback, progress_hook)
+
+    return downloader
+
+
+# --serve 모드의 요청 처리기 만들기
+# 패치 파일 캐시를 '/<구글 드라이브 ID>.zip'(Range 지원)과 '/<ID>.zip.sha256', '/index.json'으로 제공합니다.
+def make_mirror_request_handler(cache):
+    import http.server
+
+    class MirrorRequestHandler(http.server.BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            logger.info(f"{self.address_string()} {format % args}")
+
+        def do_HEAD(self):
+            self.handle_request(send_body=False)
+
+        def do_GET(self):
+            self.handle_request(send_body=True)
+
+        def send_bytes(self, body, content_type, send_body):
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if send_body:
+                self.wfile.write(body)
+
+        def handle_request(self, send_body):
+            if self.path == "/index.json":
+                body = json.dumps(cache.drive_ids()).encode("utf-8")
+                self.send_bytes(body, "application/json", send_body)
+                return
+
+            match = re.fullmatch(r"/([0-9A-Za-z_-]+)\.zip(\.sha256)?", self.path)
+            zip_path = cache.get(match.group(1)) if match else None
+            if zip_path is None:
+                self.send_error(404)
+                return
+            if match.group(2):
+                # 캐시 파일 이름이 곧 내용의 SHA-256
+                self.send_bytes(zip_path.stem.encode("ascii"), "text/plain", send_body)
+                return
+
+            size = zip_path.stat().st_size
+            start, end = 0, size - 1
+            range_match = re.fullmatch(
+                r"bytes=(\d+)-(\d*)", self.headers.get("Range", "")
+            )
+            if range_match:
+                start = int(range_match.group(1))
+                if range_match.group(2):
+                    end = min(int(range_match.group(2)), end)
+                if start > end:
+                    self.send_error(416)
+                    return
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            else:
+                self.send_response(200)
+            self.send_header("Content-Type", "application/zip")
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Length", str(end - start + 1))
+            self.end_headers()
+            if not send_body:
+                return
+            with open(zip_path, "rb") as file:
+                file.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = file.read(min(remaining, COPY_BUFFER_SIZE))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    remaining -= len(chunk)
+
+    return MirrorRequestHandler
+
+
+# 패치 파일 캐시를 같은 네트워크의 다른 PC에 제공 (Ctrl+C로 종료)
+def run_mirror_server(args):
+    import http.server
+
+    cache = ArchiveCache(args.cache_dir) if args.cache_dir else get_archive_cache()
+    server = http.server.ThreadingHTTPServer(
+        (args.serve_address, args.serve), make_mirror_request_handler(cache)
+    )
+    host, port = server.server_address[:2]
+    print(
+        json.dumps(
+            {
+                "event": "serving",
+                "time": time.time(),
+                "address": f"http://{host}:{port}/",
+                "cache_dir": str(cache.cache_dir),
+            },
+            ensure_ascii=False,
+        ),
+        flush=True,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return EXIT_OK
+
+
+# 쉼표로 구분한 미러 목록 해석
+def parse_mirror_sources(text):
+    return [source.strip() for source in text.split(",") if source.strip()]
+
+
+# 용량 문자열 해석 (예: "500K", "5M", "1G", "1048576")
+def parse_byte_size(text):
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMG]?)i?B?\s*", text, re.IGNORECASE)
+    if not match:
+        raise argparse.ArgumentTypeError(f"용량 형식이 올바르지 않습니다: {text}")
+    multiplier = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}[match.group(2).upper()]
+    return int(float(match.group(1)) * multiplier)
+
+
+# 명령줄 인자 설정
+def build_argument_parser():
+    parser = argparse.ArgumentParser(description="쓰르라미 울 적에 한글 패치 마법사")
+    parser.add_argument(
+        "--cli", action="store_true", help="창을 띄우지 않고 명령줄 모드로 실행합니다."
+    )
+    parser.add_argument(
+        "--chapters",
+        default="installed",
+        help="패치할 챕터 (쉼표로 구분: 번호, key, 앱 ID, all, installed)",
+    )
+    parser.add_argument("--steam-root", help="Steam 설치 경로 (기본값: 레지스트리)")
+    parser.add_argument("--cache-dir", help="패치 파일 캐시 경로")
+    parser.add_argument(
+        "--mirror",
+        help="'<구글 드라이브 ID>.zip' 파일이 있는 로컬 미러 폴더 또는 HTTP 주소 (쉼표로 여러 개 지정)",
+    )
+    parser.add_argument(
+        "--serve",
+        nargs="?",
+        type=int,
+        const=MIRROR_SERVER_PORT,
+        help="패치 파일 캐시를 같은 네트워크의 다른 PC에 HTTP로 제공합니다. (기본 포트: %(const)s)",
+    )
+    parser.add_argument(
+        "--serve-address",
+        default=MIRROR_SERVER_ADDRESS,
+        help="--serve 모드에서 사용할 주소",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=DOWNLOAD_WORKERS, help="동시 다운로드 수"
+    )
+    parser.add_argument(
+        "--limit-rate",
+        type=parse_byte_size,
+        default=DOWNLOAD_RATE_LIMIT,
+        help="전체 다운로드 속도 제한 (초당 바이트, 예: 500K, 5M / 0은 제한 없음)",
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=DOWNLOAD_MAX_CONNECTIONS,
+        help="동시에 사용할 최대 연결 수",
+    )
+    parser.add_argument(
+        "--order",
+        choices=DOWNLOAD_ORDERS,
+        default=DOWNLOAD_ORDER,
+        help="다운로드 순서 (smallest: 작은 챕터부터, priority: --chapters에 적은 순서, list: 챕터 순서)",
+    )
+    parser.add_argument(
+        "--no-preflight",
+        action="store_true",
+        help="설치 전 디스크 공간 점검을 건너뜁니다.",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="선택한 챕터의 한글 패치 적용 상태만 확인합니다.",
+    )
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="--verify에서 모든 파일의 CRC32를 다시 계산합니다.",
+    )
+    parser.add_argument(
+        "--uninstall",
+        action="store_true",
+        help="선택한 챕터의 한글 패치를 제거하고 원본 파일을 복원합니다.",
+    )
+    parser.add_argument(
+        "--no-steamgrid",
+        action="store_true",
+        help="Steamgrid 이미지를 적용하지 않습니다.",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="모듈별 import 시간(모듈 수준 import 포함)과 첫 창 표시 시간을 기록합니다.",
+    )
+    return parser
+
+
+# 챕터 지정 문자열 해석
+# 알 수 없는 항목은 unknown 목록으로 돌려줍니다.
+# keep_order가 True이면 지정한 순서를 유지합니다.
+def select_chapters(selectors, chapters, library_index, keep_order=False):
+    selected = []
+    unknown = []
+    for token in selectors.split(","):
+        token = token.strip().lower()
+        if not token:
+            continue
+        if token == "all":
+            matched = chapters
+        elif token == "installed":
+            matched = [
+                chapter
+                for chapter in chapters
+                if find_game_install_path(library_index, chapter)
+            ]
+        else:
+            matched = [
+                chapter
+                for number, chapter in enumerate(chapters, start=1)
+                if token in (chapter["key"], chapter.get("app_id"), str(number))
+            ]
+            if not matched:
+                unknown.append(token)
+        for chapter in matched:
+            if chapter not in selected:
+                selected.append(chapter)
+    # 챕터 순서대로 정렬
+    if not keep_order:
+        selected.sort(key=chapters.index)
+    return selected, unknown
+
+
+# 명령줄 모드 실행
+# 표준 출력에는 한 줄에 하나씩 JSON 이벤트만 기록하고, 종료 코드를 반환합니다.
+def run_cli(args):
+    output = sys.stdout
+    # 일반 출력(print)은 표준 오류로 보내 JSON 이벤트와 섞이지 않도록 처리
+    sys.stdout = sys.stderr
+    output_lock = threading.Lock()
+
+    def emit(event, **data):
+        line = json.dumps(
+            {"event": event, "time": time.time(), **data}, ensure_ascii=False
+        )
+        with output_lock:
+            output.write(line + "\n")
+            output.flush()
+
+    steam_path = args.steam_root or get_steam_install_path()
+    if not steam_path:
+        emit("error", message="Steam 설치 경로를 확인할 수 없습니다.")
+        return EXIT_STEAM_NOT_FOUND
     library_paths = get_steam_library_folders(steam_path)
     if not library_paths:
-        messagebox.showerror("오류", "Steam 라이브러리 폴더를 찾을 수 없습니다.")
-        exit()
+        emit("error", message="Steam 라이브러리 폴더를 찾을 수 없습니다.")
+        return EXIT_STEAM_NOT_FOUND
+    with get_run_report().stage("discovery", libraries=len(library_paths)) as metrics:
+        library_index = load_steam_library_index(steam_path, library_paths)
+        metrics["apps"] = len(library_index["apps"])
+
+    chapters = build_chapter_list(fetch_chapter_manifest())
+    selected, unknown = select_chapters(
+        args.chapters, chapters, library_index, args.order == "priority"
+    )
+    for priority, chapter in enumerate(selected):
+        chapter["priority"] = priority
+    if unknown:
+        emit("error", message=f"알 수 없는 챕터입니다: {', '.join(unknown)}")
+        return EXIT_USAGE_ERROR
+
+    jobs = []
+    for chapter in selected:
+        game_path = find_game_install_path(library_index, chapter)
+        if not game_path or not game_path.exists():
+            emit(
+                "chapter_skipped",
+                chapter=chapter["key"],
+                message="게임 폴더를 찾을 수 없어 건너뛰었습니다.",
+            )
+            continue
+        jobs.append((chapter, game_path))
+
+    if args.uninstall:
+        return run_cli_uninstall(jobs, emit)
+    if args.verify:
+        cache = ArchiveCache(args.cache_dir) if args.cache_dir else get_archive_cache()
+        return run_cli_verify(jobs, emit, cache, args.deep)
+
+    cache = ArchiveCache(args.cache_dir) if args.cache_dir else get_archive_cache()
+    if not args.no_preflight and jobs:
+        plan = plan_installation(
+            jobs,
+            cache,
+            pin_cache=bool(args.cache_dir),
+            mirror_sources=parse_mirror_sources(args.mirror) if args.mirror else None,
+        )
+        emit("preflight", **plan)
+        if not plan["ok"]:
+            emit("error", message="디스크 공간이 부족하여 패치를 설치할 수 없습니다.")
+            return EXIT_INSUFFICIENT_SPACE
+        if not args.cache_dir and Path(plan["cache_dir"]) != cache.cache_dir:
+            cache = ArchiveCache(plan["cache_dir"], fallback=cache, temporary=True)
+        archive_sizes = {
+            info["chapter"]: info["archive_size"] for info in plan["chapters"]
+        }
+    else:
+        archive_sizes = None
+
+    emit("start", chapters=[chapter["key"] for chapter, _ in jobs])
+    downloader = (
+        make_mirror_downloader(
+            parse_mirror_sources(args.mirror),
+            expected_hashes={
+                chapter["google_drive_id"]: chapter.get("archive_sha256")
+                for chapter, _ in jobs
+            },
+        )
+        if args.mirror
+        else None
+    )
+    try:
+        patched_chapters = run_patch_pipeline(
+            jobs,
+            download_workers=max(1, args.workers),
+            cache=cache,
+            downloader=downloader,
+            event_callback=lambda event, chapter, data: emit(
+                event, chapter=chapter["key"], **data
+            ),
+            download_order=args.order,
+            archive_sizes=archive_sizes,
+        )
+    finally:
+        # 공간이 부족한 드라이브를 피해 임시로 받은 파일은 설치 후 삭제
+        if cache.temporary:
+            cache.remove()
+    emit("download_stats", **get_download_scheduler().stats())
+
+    if not args.no_steamgrid:
+        emit("steamgrid", **apply_steamgrid_images(steam_path))
+
+    failed_count = len(jobs) - len(patched_chapters)
+    emit(
+        "finish",
+        patched=len(patched_chapters),
+        failed=failed_count,
+        skipped=len(selected) - len(jobs),
+    )
+    if failed_count:
+        return EXIT_PATCH_FAILED
+    if not jobs:
+        return EXIT_NOTHING_TO_PATCH
+    return EXIT_OK
+
+
+# 명령줄 모드에서 한글 패치 제거
+def run_cli_uninstall(jobs, emit):
+    emit("uninstall_start", chapters=[chapter["key"] for chapter, _ in jobs])
+    failed_count = 0
+    for chapter, game_path in jobs:
+        try:
+            removed = uninstall_patch(
+                game_path,
+                lambda message: emit("status", chapter=chapter["key"], message=message),
+            )
+        except Exception as e:
+            emit("status", chapter=chapter["key"], message=str(e))
+            removed = False
+        if not removed:
+            failed_count += 1
+        emit(
+            "chapter_uninstalled" if removed else "chapter_failed",
+            chapter=chapter["key"],
+            game_path=str(game_path),
+        )
+    emit("finish", uninstalled=len(jobs) - failed_count, failed=failed_count)
+    if failed_count:
+        return EXIT_PATCH_FAILED
+    if not jobs:
+        return EXIT_NOTHING_TO_PATCH
+    return EXIT_OK
+
+
+# 명령줄 모드에서 한글 패치 적용 상태 확인
+# 모든 챕터가 적용된 상태이면 0, 아니면 1을 반환합니다.
+def run_cli_verify(jobs, emit, cache, deep=False):
+    not_installed_count = 0
+    for chapter, game_path in jobs:
+        started_at = time.perf_counter()
+        zip_path = cache.get(chapter["google_drive_id"])
+        try:
+            result = verify_patch_installation(
+                game_path,
+                zip_path,
+                chapter.get("special_handling", False),
+                deep,
+                archive_hash=zip_path.stem if zip_path else None,
+                patch_version=chapter.get("patch_version"),
+            )
+        except Exception as e:
+            not_installed_count += 1
+            emit(
+                "error",
+                chapter=chapter["key"],
+                message=f"패치 상태 확인 중 오류 발생: {e}",
+            )
+            continue
+        if result["status"] != "installed":
+            not_installed_count += 1
+        emit(
+            "chapter_verified",
+            chapter=chapter["key"],
+            seconds=time.perf_counter() - started_at,
+            **result,
+        )
+    emit(
+        "finish",
+        installed=len(jobs) - not_installed_count,
+        not_installed=not_installed_count,
+    )
+    if not_installed_count:
+        return EXIT_PATCH_FAILED
+    if not jobs:
+        return EXIT_NOTHING_TO_PATCH
+    return EXIT_OK
+
+
+# 모듈 로딩이 끝난 시각
+MODULE_LOADED_TIME = time.perf_counter()
+
+
+# 메인 실행
+if __name__ == "__main__":
+    args = build_argument_parser().parse_args()
+    # 로그는 실행 파일 옆의 kr_patch.log에 남기고, 명령줄 모드의 JSON 이벤트는 stdout에 그대로 출력
+    setup_logging()
+    configure_download_scheduler(args.limit_rate, max(1, args.max_connections))
+
+    # 시작 시간 측정 모드 (import 기록은 파일 맨 위에서 시작)
+    import_timer = _startup_import_timer
+    startup_profile_path = get_app_data_dir() / "startup_profile.json"
+
+    # 창 없이 명령줄 모드로 실행
+    if args.cli:
+        exit_code = run_cli(args)
+        write_run_report()
+        if import_timer is not None:
+            import_timer.uninstall()
+            import_timer.write_report(startup_profile_path)
+        sys.exit(exit_code)
+    # 패치 파일 캐시를 다른 PC에 제공
+    if args.serve is not None:
+        sys.exit(run_mirror_server(args))
 
-    # 설치된 챕터 자동 감지
-    for chapter in chapters:
-        folder_name = chapter["name"]
-        game_path = find_game_install_path_by_name(library_paths, folder_name)
-        chapter["installed"] = game_path is not None
+    # 작업표시줄 아이콘 설정
+    set_app_user_model_id()
 
-    # UI 생성
+    # UI를 먼저 띄우고 업데이트 확인과 챕터 감지는 백그라운드에서 진행
     root = tk.Tk()
-    app = PatchInstallerUI(root, chapters, library_paths)
+    # 첫 창은 마지막으로 받은 챕터 목록으로 바로 표시하고, 원격 목록은 백그라운드에서 갱신
+    cached_manifest = load_cached_chapter_manifest()
+    app = PatchInstallerUI(
+        root,
+        build_chapter_list(cached_manifest and cached_manifest["manifest"]),
+        mirror_sources=parse_mirror_sources(args.mirror) if args.mirror else None,
+    )
+    app.start_background_startup()
     root.mainloop()
 
+    if import_timer is not None:
+        import_timer.uninstall()
+        import_timer.write_report(startup_profile_path, app.time_to_first_window)
+
     # 패치 설치 후 Steamgrid 이미지 적용
-    apply_steamgrid_images(steam_path)
+    if app.steam_path:
+        apply_steamgrid_images(app.steam_path)
+    write_run_report()